@@ -140,8 +140,8 @@ class EdgeList:
 
         # Case 1: param is a dictionary
         if isinstance(param, dict):
-            self.config = ParamConfig(**param, required_fields=required_fields)
-            self.config.validate()  # Validate all required fields in the dictionary
+            self.config = ParamConfig(**param)
+            self.config.validate(required_fields)  # Validate all required fields in the dictionary
 
         # Case 2: param is already a ParamConfig
         elif isinstance(param, ParamConfig):
@@ -275,7 +275,7 @@ class EdgeList:
         from transnetmap.pre.nptm import NPTM
         from transnetmap.pre.network import Network
         from transnetmap.pre.pvs import PVS_TravelTime
-        from transnetmap.utils.constant import DCT_LEVEL, DCT_TYPE, generate_level_to_type_mapping
+        from transnetmap.utils.constant import DCT_LEVEL, DCT_TYPE, DCT_TYPE_INV, LEVEL_TO_TYPE
         from transnetmap.utils.time_tools import import_time_function
         
         print("\nThe creation of the edgelist start.\n")
@@ -317,8 +317,8 @@ class EdgeList:
         }
         columns = ['from', 'to', 'type', EdgeList.OPTIMISATION_METRIC, 'length']
         
-        # Step 3: Generate mappings
-        level_to_type_mapping = generate_level_to_type_mapping(DCT_LEVEL, DCT_TYPE)   
+        # Step 3: Mappings (precomputed at import in `transnetmap.utils.constant`)
+        level_to_type_mapping = LEVEL_TO_TYPE
 
         # Step 4: Prepare the edges list from the network
         network_edgelist = network.table[["id_a", "id_b", "level", "length"]].copy().astype({'level': 'int8'})
@@ -406,8 +406,8 @@ class EdgeList:
         
         else:
             # Map type values back to their original keys for clarity (str)
-            df_irrelevant["type"] = df_irrelevant["type"].map(dict(map(reversed, DCT_TYPE.items())))
-            df_irrelevant["type_nptm"] = df_irrelevant["type_nptm"].map(dict(map(reversed, DCT_TYPE.items())))            
+            df_irrelevant["type"] = df_irrelevant["type"].map(DCT_TYPE_INV)
+            df_irrelevant["type_nptm"] = df_irrelevant["type_nptm"].map(DCT_TYPE_INV)            
             
             # Select and rename columns for better readability in the final pandas DataFrame
             self.irrelevant = (
@@ -625,7 +625,9 @@ class EdgeList:
         ...     if_exists='replace'
         ... )
         """
-        from transnetmap.utils.sql import define_schema, schema_exists, execute_primary_key_script
+        from transnetmap.utils.sql import (
+            define_schema, schema_exists, execute_primary_key_script, invalidate_exists_cache
+        )
         from transnetmap.utils.constant import IMPACTS
         import time
     
@@ -679,6 +681,9 @@ class EdgeList:
             )
         except Exception as e:
             raise RuntimeError(f"An error occurred while writing to the database: {e}")
+        finally:
+            # The write may have replaced the table: drop cached existence answers
+            invalidate_exists_cache(self.uri)
     
         #  Step 7: Add primary key to table
         execute_primary_key_script(
@@ -687,7 +692,8 @@ class EdgeList:
             list_columns=["from", "to"],
             schema=schema,
             include_schema_in_pk_name=True,
-            print_status=self.main_print
+            print_status=self.main_print,
+            validate=False,  # Table just written
         )
     
         elapsed_time = round(time.time() - start_time)
@@ -18,7 +18,7 @@ import polars as pl
 import networkx as nx
 
 from transnetmap.analysis.edgelist import EdgeList
-from transnetmap.utils.utils import spinner, convert_to_pg_array
+from transnetmap.utils.utils import spinner, convert_paths_to_pg_array
 
 if TYPE_CHECKING:  # noqa: F401
     from transnetmap.utils.config import ParamConfig
@@ -442,7 +442,9 @@ class Graph(EdgeList):
             `SMALLINT[]` (array of smallint).
         - Adds a composite primary key on the columns `["from", "to"]`.
         """
-        from transnetmap.utils.sql import schema_exists, execute_sql_script, execute_primary_key_script
+        from transnetmap.utils.sql import (
+            schema_exists, execute_sql_script, execute_primary_key_script, invalidate_exists_cache
+        )
         import time
     
         #  Step 1: Validate parameters
@@ -478,9 +480,8 @@ class Graph(EdgeList):
         )
     
         #  Step 5: Convert paths to PostgreSQL format
-        path = self.optimisation['path'].to_pandas().apply(lambda x: convert_to_pg_array(x))
-        path = pl.from_pandas(path)
-        self.optimisation = self.optimisation.replace_column(-1, pl.Series('path', path)).sort(['from', 'to'])
+        path = convert_paths_to_pg_array(self.optimisation['path'].to_list())
+        self.optimisation = self.optimisation.replace_column(-1, pl.Series('path', path, dtype=pl.String)).sort(['from', 'to'])
     
         #  Step 6: Measure time for database write
         start_time = time.time()
@@ -495,6 +496,9 @@ class Graph(EdgeList):
             )
         except Exception as e:
             raise RuntimeError(f"Error while writing to the database: {e}")
+        finally:
+            # The write may have replaced the table: drop cached existence answers
+            invalidate_exists_cache(self.uri)
     
         #  Step 8: Adjust column type for PostgreSQL array
         script = f"""
@@ -514,7 +518,8 @@ class Graph(EdgeList):
             list_columns=["from", "to"],
             schema=schema,
             include_schema_in_pk_name=True,
-            print_status=self.config.main_print
+            print_status=self.config.main_print,
+            validate=False,  # Table just written
         )
     
         #  Step 10: Log success message
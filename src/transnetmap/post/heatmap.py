@@ -84,7 +84,7 @@ Notes
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Union, Optional, List, Dict, Tuple, Any
+from typing import TYPE_CHECKING, Union, Optional, List, Dict, Tuple, Any, Sequence
 from itertools import permutations
 
 import numpy as np
@@ -598,7 +598,7 @@ class HeatMap(Results):
         save_to_desktop: Optional[bool] = None,
         custom_path: Optional[str] = None,
         open_browser: Optional[bool] = None,
-        map_tiles: Optional[List[str]] = None,
+        map_tiles: Optional[Sequence[str]] = None,
         include_stations: Optional[bool] = None,
         include_network_layers: Optional[bool] = None,
     ) -> Optional[folium.Map]:
@@ -644,7 +644,7 @@ class HeatMap(Results):
         open_browser : bool, optional
             If True, the generated map will open automatically in the browser after saving.
         
-        map_tiles : list of str, optional
+        map_tiles : sequence of str, optional
             List of background tile layers to load (e.g., `"CartoDB Voyager"`, `"OpenStreetMap"`).   
             Defaults to config settings. The first tile is used as the default background.
         
@@ -224,8 +224,8 @@ class Results:
         #  Step 2: Validate the parameters
         # Case 1: param is a dictionary
         if isinstance(param, dict):
-            self.config = ParamConfig(**param, required_fields=required_fields)
-            self.config.validate()  # Validate all required fields in the dictionary
+            self.config = ParamConfig(**param)
+            self.config.validate(required_fields)  # Validate all required fields in the dictionary
 
         # Case 2: param is already a ParamConfig
         elif isinstance(param, ParamConfig):
@@ -1091,7 +1091,7 @@ class Results:
     
             # Extract and verify impact data (Pandas to Polars conversion)
             impact_table = impact_instance.table[required_impact_columns].copy()
-            impact_table["type"] = impact_table["type"].map(DCT_TYPE)
+            impact_table["type"] = impact_table["type"].map(DCT_TYPE).astype("int8")
             impact_pl = pl.from_pandas(impact_table).sort(["type", "max_distance"], nulls_last=True)
     
             # Store results per impact type
@@ -1471,9 +1471,11 @@ class Results:
             SMALLINT[] (array of smallint).
         - Adds a composite primary key on the columns ["from", "to", "type"].
         """
-        from transnetmap.utils.sql import schema_exists, execute_sql_script, execute_primary_key_script
+        from transnetmap.utils.sql import (
+            schema_exists, execute_sql_script, execute_primary_key_script, invalidate_exists_cache
+        )
         from transnetmap.utils.constant import IMPACTS
-        from transnetmap.utils.utils import convert_to_pg_array
+        from transnetmap.utils.utils import convert_paths_to_pg_array
     
         #  Step 1: Validate parameters
         if if_exists not in ['fail', 'replace']:
@@ -1510,9 +1512,8 @@ class Results:
         )
     
         #  Step 5: Convert paths to PostgreSQL format
-        path = self.table['path'].to_pandas().apply(lambda x: convert_to_pg_array(x))
-        path = pl.from_pandas(path)
-        self.table = self.table.replace_column(-1, pl.Series('path', path)).sort(['from', 'to', 'type'])
+        path = convert_paths_to_pg_array(self.table['path'].to_list())
+        self.table = self.table.replace_column(-1, pl.Series('path', path, dtype=pl.String)).sort(['from', 'to', 'type'])
     
         #  Step 6: Write table using ADBC engine
         try:
@@ -1524,6 +1525,9 @@ class Results:
             )
         except Exception as e:
             raise RuntimeError(f"Error while writing to the database: {e}")
+        finally:
+            # The write may have replaced the table: drop cached existence answers
+            invalidate_exists_cache(self.uri)
     
         #  Step 7: Adjust column type for PostgreSQL array
         script = f"""
@@ -1543,7 +1547,8 @@ class Results:
             list_columns=["from", "to", "type"],
             schema=schema,
             include_schema_in_pk_name=True,
-            print_status=self.config.main_print
+            print_status=self.config.main_print,
+            validate=False,  # Table just written
         )
     
         #  Step 9: Log success message
@@ -125,8 +125,8 @@ class Network:
 
         # Case 1: param is a dictionary
         if isinstance(param, dict):
-            self.config = ParamConfig(**param, required_fields=required_fields)
-            self.config.validate()  # Validate all required fields in the dictionary
+            self.config = ParamConfig(**param)
+            self.config.validate(required_fields)  # Validate all required fields in the dictionary
 
         # Case 2: param is already a ParamConfig
         elif isinstance(param, ParamConfig):
@@ -190,6 +190,7 @@ class Network:
             schema_exists,
             execute_sql_script,
             execute_primary_key_script,
+            invalidate_exists_cache,
             table_exists
         )
         
@@ -246,6 +247,9 @@ class Network:
                 )
         except Exception as e:
             raise RuntimeError(f"An error occurred while writing to the database: {e}")
+        finally:
+            # The write may have replaced the table: drop cached existence answers
+            invalidate_exists_cache(self.uri)
             
         # add primary key to table
         execute_primary_key_script(
@@ -254,7 +258,8 @@ class Network:
             list_columns=["id_a","id_b"],
             schema=schema,
             include_schema_in_pk_name=False,
-            print_status=self.main_print
+            print_status=self.main_print,
+            validate=False,  # Table just written
         )
         
         script = f'''
@@ -127,8 +127,8 @@ class Stations:
         
         # Case 1: param is a dictionary
         if isinstance(param, dict):
-            self.config = ParamConfig(**param, required_fields=required_fields)
-            self.config.validate()  # Validate all required fields in the dictionary
+            self.config = ParamConfig(**param)
+            self.config.validate(required_fields)  # Validate all required fields in the dictionary
         
         # Case 2: param is already a ParamConfig
         elif isinstance(param, ParamConfig):
@@ -191,7 +191,9 @@ class Stations:
         """
         from sqlalchemy import create_engine
         from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, SMALLINT, VARCHAR
-        from transnetmap.utils.sql import define_schema, schema_exists, execute_primary_key_script
+        from transnetmap.utils.sql import (
+            define_schema, schema_exists, execute_primary_key_script, invalidate_exists_cache
+        )
         
         # Prohibit "append" to avoid data duplication issues
         if if_exists == 'append':
@@ -232,6 +234,9 @@ class Stations:
                 )
         except Exception as e:
             raise RuntimeError(f"An error occurred while writing to the database: {e}")
+        finally:
+            # The write may have replaced the table: drop cached existence answers
+            invalidate_exists_cache(self.uri)
         
         # add primary key to table
         execute_primary_key_script(
@@ -240,7 +245,8 @@ class Stations:
             list_columns=["id"],
             schema=schema,
             include_schema_in_pk_name=False,
-            print_status=self.main_print
+            print_status=self.main_print,
+            validate=False,  # Table just written
         )
         
         if self.main_print:
@@ -661,8 +667,8 @@ class Links:
 
         # Case 1: param is a dictionary
         if isinstance(param, dict):
-            self.config = ParamConfig(**param, required_fields=required_fields)
-            self.config.validate()  # Validate all required fields in the dictionary
+            self.config = ParamConfig(**param)
+            self.config.validate(required_fields)  # Validate all required fields in the dictionary
 
         # Case 2: param is already a ParamConfig
         elif isinstance(param, ParamConfig):
@@ -725,7 +731,7 @@ class Links:
         """
         from sqlalchemy import create_engine
         from sqlalchemy.dialects.postgresql import VARCHAR
-        from transnetmap.utils.sql import define_schema, schema_exists
+        from transnetmap.utils.sql import define_schema, schema_exists, invalidate_exists_cache
         
         # Prohibit "append" to avoid data duplication issues
         if if_exists == 'append':
@@ -767,6 +773,9 @@ class Links:
                 )
         except Exception as e:
             raise RuntimeError(f"An error occurred while writing to the database: {e}")
+        finally:
+            # The write may have replaced the table: drop cached existence answers
+            invalidate_exists_cache(self.uri)
         
         # add primary key to table
         ### The format of the links table does not allow it to contain a primary key ###
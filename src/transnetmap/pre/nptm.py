@@ -141,8 +141,8 @@ class NPTM:
         
         # Case 1: param is a dictionary
         if isinstance(param, dict):
-            self.config = ParamConfig(**param, required_fields=required_fields)
-            self.config.validate()  # Validate all required fields in the dictionary
+            self.config = ParamConfig(**param)
+            self.config.validate(required_fields)  # Validate all required fields in the dictionary
         
         # Case 2: param is already a ParamConfig
         elif isinstance(param, ParamConfig):
@@ -262,7 +262,7 @@ class NPTM:
           only if the metric is guaranteed to be symmetric by construction.
         """
         from transnetmap.utils.constant import DCT_TYPE
-        from transnetmap.utils.utils import convert_to_pg_array
+        from transnetmap.utils.utils import convert_paths_to_pg_array
         
         self._validate_zone_ids(zones_gdf)            
         
@@ -335,8 +335,8 @@ class NPTM:
         )
         # Convert paths to PostgreSQL arrays
         for mtx in [imt_mtx, pt_mtx]:
-            path = mtx['path'].to_pandas().apply(lambda x: convert_to_pg_array(x))
-            mtx.replace_column(-1, pl.Series('path', pl.from_pandas(path)))
+            path = convert_paths_to_pg_array(mtx['path'].to_list())
+            mtx.replace_column(-1, pl.Series('path', path, dtype=pl.String))
 
         # Assign types
         imt_mtx = imt_mtx.with_columns(
@@ -721,7 +721,7 @@ class NPTM:
         """
         from sqlalchemy import create_engine
         from sqlalchemy.dialects.postgresql import SMALLINT
-        from transnetmap.utils.sql import define_schema, schema_exists, execute_sql_script
+        from transnetmap.utils.sql import define_schema, schema_exists, execute_sql_script, invalidate_exists_cache
         import time
     
         # ===============================
@@ -748,6 +748,9 @@ class NPTM:
                 )
             except Exception as e:
                 raise RuntimeError(f"An error occurred while writing to the database: {e}")
+            finally:
+                # The write may have replaced the table: drop cached existence answers
+                invalidate_exists_cache(self.uri)
             
             # Format path as SMALLINT[], set primary key and add comment
             script = f'''
@@ -790,6 +793,9 @@ class NPTM:
                     )
             except Exception as e:
                 raise RuntimeError(f"An error occurred while writing to the database: {e}")
+            finally:
+                # The write may have replaced the table: drop cached existence answers
+                invalidate_exists_cache(self.uri)
             
             # Set primary key and add comment            
             script = f'''
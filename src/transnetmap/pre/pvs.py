@@ -14,19 +14,122 @@ Notes
 
 from __future__ import annotations
 
+import warnings
 from typing import TYPE_CHECKING, Optional, Union
 
 import numpy as np
 import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import VARCHAR, TEXT, REAL
 
 from transnetmap.utils.config import ParamConfig
+from transnetmap.utils.constant import DCT_TYPE, IMPACTS
+from transnetmap.utils.sql import (
+    define_schema, schema_exists, execute_primary_key_script, insert_copy_from, table_exists,
+    invalidate_exists_cache
+)
+from transnetmap.utils.utils import validate_input_file_name
 
 if TYPE_CHECKING:  # noqa: F401
     from pathlib import Path
+    from sqlalchemy.engine import Engine
 
 __all__ = ["PVS_TravelTime", "PVS_Impacts"]
 
 
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+_CACHE_SOURCE_KEY = b"transnetmap.source"
+""" Parquet metadata key holding the fingerprint of the CSV a cached table was validated from. """
+
+
+def _csv_fingerprint(file: Path) -> bytes:
+    """
+    Fingerprint of a CSV file for the Parquet cache of `PVS_Impacts.read_csv`: its size and
+    modification time in nanoseconds, both required to match exactly (an older file copied over
+    the CSV, e.g. with ``cp -p``, still invalidates the cache).
+    """
+    stat = file.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}".encode()
+
+
+def _parse_float32_column(values: np.ndarray, col: str) -> np.ndarray:
+    """
+    Parses a column read as strings (CSV) or objects (SQL) into a float32 array.
+
+    Null cells, ``"-"`` and ``""`` become NaN; any other value must be numeric.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Raw values of the column (object dtype).
+    col : str
+        Name of the column, used in the error message.
+
+    Returns
+    -------
+    numpy.ndarray
+        The parsed values (float32).
+
+    Raises
+    ------
+    ValueError
+        If a value is neither missing nor numeric.
+    """
+    # `pd.Series.isin` hashes the values: safe on mixed str/float objects (`np.isin` sorts them)
+    missing = pd.isna(values) | pd.Series(values, dtype=object).isin(["-", ""]).to_numpy()
+    parsed = np.full(len(values), np.nan, dtype=np.float32)
+    try:
+        parsed[~missing] = np.asarray(values[~missing], dtype=np.float32)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"The '{col}' column contains non-numeric values: {e}") from e
+    return parsed
+
+
+def _check_max_distance_runs(
+    type_codes: np.ndarray,
+    max_distance: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Checks the 'type' / 'max_distance' rule of `PVS_Impacts` in a single pass over sorted runs.
+
+    Rows are sorted by (type code, max_distance) so that each type forms one contiguous run with
+    its NaN last; per-run sizes, NaN counts and repeated distances are then reduced with `np.add.reduceat`.
+
+    Parameters
+    ----------
+    type_codes : numpy.ndarray
+        Integer code of the 'type' of each row (e.g., from `pd.factorize`).
+    max_distance : numpy.ndarray
+        'max_distance' of each row (floating point, NaN for the open-ended row).
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        - type code of each run,
+        - runs of a single row whose 'max_distance' is not NaN,
+        - runs of several rows without exactly one NaN,
+        - runs of several rows with repeated non-NaN distances.
+    """
+    order = np.lexsort((max_distance, type_codes))
+    codes = type_codes[order]
+    distances = max_distance[order]
+
+    same_type = codes[1:] == codes[:-1]
+    starts = np.flatnonzero(np.r_[True, ~same_type])
+    size = np.diff(np.r_[starts, codes.size])
+    nan_count = np.add.reduceat(np.isnan(distances).astype(np.intp), starts)
+    # NaN != NaN, so only repeated numeric distances are counted
+    repeated = np.r_[same_type & (distances[1:] == distances[:-1]), False]
+    repeated_count = np.add.reduceat(repeated.astype(np.intp), starts)
+
+    bad_single = (size == 1) & (nan_count != 1)
+    bad_nan = (size > 1) & (nan_count != 1)
+    bad_unique = (size > 1) & (repeated_count > 0)
+    return codes[starts], bad_single, bad_nan, bad_unique
+
+
 # -----------------------------------------------------------------------------
 # Class: PVS_TravelTime
 # -----------------------------------------------------------------------------
@@ -47,6 +150,9 @@ class PVS_TravelTime:
     _type : str
     
         The type of object, always set to 'travel_time'.
+    _required_columns : tuple of str
+    
+        The columns expected in the CSV/SQL table, in order.
 
     Attributes
     ----------
@@ -69,10 +175,19 @@ class PVS_TravelTime:
         Indicates whether execution information should be printed to the console.
     sql_echo : bool
         Indicates whether SQL query logs should be displayed.
+    engine : sqlalchemy.engine.Engine
+        SQLAlchemy engine built lazily from `uri` and reused across database calls.
     table : pandas.DataFrame or None
         Stores the physical value set as a DataFrame after reading from CSV or database.
+        Built on access from the typed components below (mixed-type ``'value'`` column).
     dct : dict or None
         Stores the physical value set as a dictionary for easy access to parameter values.
+    _values_numeric : numpy.ndarray or None
+        Numeric values (``float64``) aligned with the rows of ``_meta``; NaN on the ``'tf_name'`` row.
+    _tf_name : str or None
+        Name of the time function (``'tf_name'`` row).
+    _meta : pandas.DataFrame or None
+        Columns ``['name', 'unit', 'description', 'comments']`` of the physical value set.
 
     Methods
     -------
@@ -107,6 +222,7 @@ class PVS_TravelTime:
     """
 
     _type = 'travel_time'  # Object type
+    _required_columns = ('name', 'value', 'unit', 'description', 'comments')
 
     def __init__(self, param: Union[dict, ParamConfig], *, required_fields: Optional[list] = None) -> None:
         """
@@ -158,8 +274,8 @@ class PVS_TravelTime:
 
         # Case 1: param is a dictionary
         if isinstance(param, dict):
-            self.config = ParamConfig(**param, required_fields=required_fields)
-            self.config.validate()  # Validate all required fields in the dictionary
+            self.config = ParamConfig(**param)
+            self.config.validate(required_fields)  # Validate all required fields in the dictionary
 
         # Case 2: param is already a ParamConfig
         elif isinstance(param, ParamConfig):
@@ -182,9 +298,37 @@ class PVS_TravelTime:
         self.main_print = self.config.main_print or (__name__ == "__main__")
         self.sql_echo = self.config.sql_echo
         
-        # Initialize placeholders for table and dct
-        self.table = None
+        # Initialize placeholders for the typed components of the table and dct
+        self._values_numeric = None
+        self._tf_name = None
+        self._meta = None
         self.dct = None
+        
+        # SQLAlchemy engine, created on first database access
+        self._engine = None
+
+
+    @property
+    def table(self) -> Optional[pd.DataFrame]:
+        """
+        Physical value set as a DataFrame (columns ``['name', 'value', 'unit', 'description', 'comments']``).
+
+        Built on access from the typed components (numeric values, time function name and metadata):
+        the mixed-type ``'value'`` column only exists at this boundary (e.g. for `to_sql`).
+        """
+        if self._meta is None:
+            return None
+        value = self._values_numeric.astype(object)
+        value[(self._meta['name'] == 'tf_name').to_numpy()] = self._tf_name
+        return self._meta.assign(value=value)[list(self._required_columns)]
+
+
+    @property
+    def engine(self) -> Engine:
+        """SQLAlchemy engine for `uri`, created once and reused by `to_sql` / `read_sql`."""
+        if self._engine is None:
+            self._engine = create_engine(self.uri, echo=self.sql_echo)
+        return self._engine
 
 
     def _log(self, message: str) -> None:
@@ -192,9 +336,14 @@ class PVS_TravelTime:
             print(message)
 
 
-    def _validate_and_process_table(self, data: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
+    def _validate_and_process_table(
+        self, data: pd.DataFrame
+    ) -> tuple[np.ndarray, str, pd.DataFrame, dict]:
         """
         Validates and processes the input table for required structure and types.
+
+        The 'value' column is parsed once into typed components; the mixed-type table is only
+        rebuilt by the `table` property.
     
         Parameters
         ----------
@@ -203,53 +352,22 @@ class PVS_TravelTime:
     
         Returns
         -------
+        numpy.ndarray
+            Numeric values (``float64``), aligned with the rows of the metadata; NaN on the 'tf_name' row.
+        str
+            Name of the time function ('tf_name' row).
         pandas.DataFrame
-            Validated and processed table.
+            Columns ``['name', 'unit', 'description', 'comments']`` of the table.
         dict
             Dictionary representation of the table.
     
         Raises
         ------
-        RuntimeError
-            If required columns or names are missing, or if data types are invalid.
+        ValueError
+            If required columns or names are missing, if names are duplicated, or if values are invalid.
         """
-        def process_entry_value(self, name, value):
-            """
-            Processes the value of a physical value entry based on its name.
-            
-            Parameters
-            ----------
-            name : str
-                The name of the physical value entry.
-            value : any
-                The raw value from the CSV or database.
-            
-            Returns
-            -------
-            int, str, or float
-                The processed value with the correct type.
-            
-            Raises
-            ------
-            ValueError
-                If the value cannot be converted to the expected type.
-            """
-            try:
-                if name == 'tf_name':
-                    return str(value)
-                return float(value)
-            except (ValueError, TypeError) as e:
-                raise ValueError(f"Error processing value for '{name}': {value}") from e
-        
-        # Convert 'value' to appropriate type
-        def safe_cast(value, target_type):
-            try:
-                return target_type(value)
-            except (ValueError, TypeError):
-                return np.nan
-        
         # Required structure
-        required_columns = set(['name', 'value', 'unit', 'description', 'comments'])
+        required_columns = set(self._required_columns)
         required_names = [
             "tf_name", "l_ff", "m_ff", "h_ff",
             "l_a_it", "l_b_it", "m_a_it", "m_b_it", "h_a_it", "h_b_it",
@@ -266,41 +384,51 @@ class PVS_TravelTime:
             raise ValueError(f"Unexpected columns: {', '.join(extra_columns)}")
     
         # Validate required names in 'name' column
-        missing_names = [name for name in required_names if name not in data['name'].tolist()]
+        names = data['name'].tolist()
+        missing_names = [name for name in required_names if name not in names]
         if missing_names:
             raise ValueError(f"Missing required names in the 'name' column: {', '.join(missing_names)}")
+        duplicate_names = data.loc[data['name'].duplicated(), 'name'].unique().tolist()
+        if duplicate_names:
+            raise ValueError(f"Duplicate names in the 'name' column: {', '.join(map(str, duplicate_names))}")
     
         # Validate 'tf_name'
-        tf_name_row = data.loc[data['name'] == 'tf_name']
-        if not tf_name_row['value'].apply(lambda x: isinstance(x, str)).all():
+        raw_values = data['value'].to_numpy(dtype=object)
+        is_tf_name = (data['name'] == 'tf_name').to_numpy()
+        tf_name = raw_values[is_tf_name][0]
+        if not (isinstance(tf_name, str) and tf_name != ""):
             raise ValueError("Invalid 'tf_name': must be a string.")
     
-        data['value'] = data.apply(
-            lambda row: safe_cast(row['value'], float) if row['name'] != 'tf_name' else row['value'],
-            axis=1
-        )
+        # Parse the numeric values once (unparsable values become NaN and are reported below)
+        values = np.full(len(raw_values), np.nan, dtype=np.float64)
+        values[~is_tf_name] = pd.to_numeric(
+            pd.Series(raw_values[~is_tf_name], dtype=object), errors='coerce'
+        ).to_numpy(dtype=np.float64, na_value=np.nan)
     
         # Validate numeric values in 'value'
-        invalid_values = data.loc[
-            (data['name'] != 'tf_name') &
-            (~data['value'].apply(lambda x: isinstance(x, (int, float)) and np.isfinite(x)))
-        ]
-        if not invalid_values.empty:
+        invalid_values = ~is_tf_name & ~np.isfinite(values)
+        if invalid_values.any():
             raise ValueError(
-                f"Invalid numeric values in the 'value' column for names: {', '.join(invalid_values['name'].tolist())}"
+                f"Invalid numeric values in the 'value' column for names: "
+                f"{', '.join(data['name'].to_numpy()[invalid_values].tolist())}"
             )
         
-        # Convert to dictionary format
-        dct = data.set_index('name').to_dict(orient='index')
-    
-        # Ensure dictionary values match expected types
-        for key, entry in dct.items():
-            entry['value'] = process_entry_value(self, key, entry['value'])
-            entry['unit'] = str(entry['unit'])
-            entry['description'] = str(entry['description'])
-            entry['comments'] = str(entry['comments']) if pd.notna(entry['comments']) else ""
+        meta = data[['name', 'unit', 'description', 'comments']].reset_index(drop=True)
+        
+        # Convert to dictionary format (values taken from the parsed components)
+        dct = {
+            name: {
+                'value': tf_name if name == 'tf_name' else float(value),
+                'unit': str(unit),
+                'description': str(description),
+                'comments': str(comments) if pd.notna(comments) else "",
+            }
+            for name, value, unit, description, comments in zip(
+                names, values.tolist(), meta['unit'], meta['description'], meta['comments']
+            )
+        }
     
-        return data, dct
+        return values, tf_name, meta, dct
 
 
     def to_sql(self, *, if_exists: str = 'fail') -> None:
@@ -330,6 +458,7 @@ class PVS_TravelTime:
         - The 'name' column is used as the primary key.
         - The table is created in the 'physical_values' schema.
         - The method uses SQLAlchemy for database interaction and supports PostgreSQL.
+        - Rows are bulk-loaded with PostgreSQL ``COPY ... FROM STDIN`` (the table itself is created by pandas).
         - Each row in the table corresponds to a specific physical parameter required for travel time calculations.
         
         Returns
@@ -342,10 +471,6 @@ class PVS_TravelTime:
         >>> pvs_travel_time.read_csv("physical_values_travel_time_1.csv")
         >>> pvs_travel_time.to_sql(if_exists='replace')
         """
-        from sqlalchemy import create_engine
-        from sqlalchemy.dialects.postgresql import VARCHAR, TEXT
-        from transnetmap.utils.sql import define_schema, schema_exists, execute_primary_key_script
-        
         # Prohibit "append" to avoid data duplication issues
         if if_exists == 'append':
             raise ValueError(
@@ -366,13 +491,14 @@ class PVS_TravelTime:
         
         # Write to the database
         try:
-            with create_engine(self.uri, echo=self.sql_echo).connect() as connection:
+            with self.engine.connect() as connection:
                 self.table.to_sql(
                     table_name,
                     connection,
                     schema=schema,
                     if_exists=if_exists,
                     index=False,
+                    method=insert_copy_from,
                     dtype={
                         'name': VARCHAR,
                         'value': VARCHAR,
@@ -383,6 +509,9 @@ class PVS_TravelTime:
                 )
         except Exception as e:
             raise RuntimeError(f"An error occurred while writing to the database: {e}")
+        finally:
+            # The write may have replaced the table: drop cached existence answers
+            invalidate_exists_cache(self.uri)
         
         # add primary key to table
         execute_primary_key_script(
@@ -391,7 +520,8 @@ class PVS_TravelTime:
             list_columns=["name"],
             schema=schema,
             include_schema_in_pk_name=False,
-            print_status=self.main_print
+            print_status=self.main_print,
+            validate=False,  # Table just written
         )
         
         self._log(f"Writing to the database is successful. Table: '{schema}.{table_name}'")
@@ -414,9 +544,6 @@ class PVS_TravelTime:
         ValueError
             If the data format is invalid.
         """
-        from transnetmap.utils.sql import table_exists
-        from sqlalchemy import create_engine
-
         # Define schema and table name
         schema = self.schema
         table_name = self.table_name
@@ -427,15 +554,15 @@ class PVS_TravelTime:
                 f'Ensure it is defined and written to the database (schema: "{schema}").'
             )
 
-        sql_query = f'SELECT * FROM "{schema}"."{table_name}"'
+        # Read through SQLAlchemy table reflection (identifiers are quoted by the dialect)
         try:
-            with create_engine(self.uri, echo=self.sql_echo).connect() as connection:
-                data = pd.read_sql_query(sql_query, connection)
+            with self.engine.connect() as connection:
+                data = pd.read_sql_table(table_name, connection, schema=schema, coerce_float=False)
         except Exception as e:
             raise RuntimeError(f"Error reading data from database: {e}")
         
         # Validate and process the table
-        self.table, self.dct = self._validate_and_process_table(data)
+        self._values_numeric, self._tf_name, self._meta, self.dct = self._validate_and_process_table(data)
 
         self._log(f"Import from database successful. Table: '{schema}.{table_name}'")
         
@@ -517,28 +644,26 @@ class PVS_TravelTime:
         >>> print(pvs.dct["tf_name"])
         {'value': 'suarm', 'unit': '-', 'description': 'Time function', 'comments': 'Symmetrical Uniform Rectilinear Motion'}
         """
-        from transnetmap.utils.utils import validate_input_file_name
-        
         # Validate file name format
         file_str_valid = f'{self.schema}_{self._type}_{self.physical_values_set_number}.csv'
         validate_input_file_name(file, file_str_valid)
             
-        # Load CSV
+        # Load CSV (every column is read, so unexpected ones are rejected during validation;
+        # empty cells are kept as "" and handled there, so NaN detection is skipped)
         try:
             data = pd.read_csv(
-                file, sep=';', dtype={
-                    'name': str,
-                    'value': str,
-                    'unit': str,
-                    'description': str,
-                    'comments': str,
-                }
+                file,
+                sep=';',
+                engine='c',
+                memory_map=True,
+                dtype={col: str for col in self._required_columns},
+                na_filter=False,
             )
         except Exception as e:
             raise ValueError(f"Error reading CSV file: {e}")
         
         # Validate and process the table
-        self.table, self.dct = self._validate_and_process_table(data)
+        self._values_numeric, self._tf_name, self._meta, self.dct = self._validate_and_process_table(data)
             
         return self
 
@@ -586,6 +711,8 @@ class PVS_Impacts:
         Indicates whether execution information should be printed to the console.
     sql_echo : bool
         Indicates whether SQL query logs should be displayed.
+    engine : sqlalchemy.engine.Engine
+        SQLAlchemy engine built lazily from `uri` and reused across database calls.
     table : pandas.DataFrame or None
         Stores the physical value set as a DataFrame after reading from CSV or database.
     dct : dict or None
@@ -611,7 +738,8 @@ class PVS_Impacts:
     - The class ensures that each physical value set is uniquely identified by its `physical_values_set_number`.
     - The `to_sql` and `read_sql` methods handle database interactions, while `read_csv` processes data from CSV files.
     - Impact types (e.g., CO2, EP, TCO) are distinguished through the `impact_type` column.
-    - Validation ensures data integrity and adherence to the expected structure, whether loaded from CSV or SQL.
+    - Validation ensures data integrity and adherence to the expected structure when loaded from CSV; tables read
+    from SQL were validated before being written and are only normalized.
     - Parameters passed during initialization are validated for completeness and type conformity.
     - The impact taxonomy and level/type mapping follow ``transnetmap.utils.constant.DCT_TYPE``.
       Ensure your impact names and columns align with these keys when loading or exporting tables.
@@ -679,8 +807,6 @@ class PVS_Impacts:
         - This method ensures that all mandatory parameters are present and that optional
           parameters are set to default values if not provided.
         """
-        from transnetmap.utils.constant import IMPACTS
-        
         # Validate the impact type
         if impact_type not in IMPACTS:
             raise ValueError(f"Invalid impact type: '{impact_type}'. Must be one of {IMPACTS}. "
@@ -695,8 +821,8 @@ class PVS_Impacts:
 
         # Case 1: param is a dictionary
         if isinstance(param, dict):
-            self.config = ParamConfig(**param, required_fields=required_fields)
-            self.config.validate()  # Validate all required fields in the dictionary
+            self.config = ParamConfig(**param)
+            self.config.validate(required_fields)  # Validate all required fields in the dictionary
 
         # Case 2: param is already a ParamConfig
         elif isinstance(param, ParamConfig):
@@ -721,6 +847,17 @@ class PVS_Impacts:
         
         # Initialize placeholders for the table
         self.table = None
+        
+        # SQLAlchemy engine, created on first database access
+        self._engine = None
+
+
+    @property
+    def engine(self) -> Engine:
+        """SQLAlchemy engine for `uri`, created once and reused by `to_sql` / `read_sql`."""
+        if self._engine is None:
+            self._engine = create_engine(self.uri, echo=self.sql_echo)
+        return self._engine
 
 
     def _log(self, message: str) -> None:
@@ -728,11 +865,11 @@ class PVS_Impacts:
             print(message)
 
 
-    def _validate_and_process_table(self, data: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
+    def _validate_and_process_table(self, data: pd.DataFrame, *, full: bool = True) -> pd.DataFrame:
         """
         Validates and processes the input table for required structure and types.
         
-        This method performs the following validations:
+        This method performs the following validations (steps 3 to 6 only when `full` is True):
         1. Ensures the table has the required columns.
         2. Converts specific columns ('max_distance', 'impact_value', 'load_percent') to `float32`.
         3. Validates the presence and consistency of mandatory columns:
@@ -745,11 +882,17 @@ class PVS_Impacts:
         5. Ensures each pair of ['type', 'impact_value'] is unique.
         6. Verifies that all required keys from the `DCT_TYPE` dictionary are present in the 'type' column, 
            excluding keys starting with "without" or "with".
+        7. Casts the low-cardinality columns ('type', 'impact_type', 'impact_unit', 'motorization')
+           to the pandas `category` dtype.
         
         Parameters
         ----------
         data : pandas.DataFrame
             The table to validate and process.
+        full : bool, optional
+            If False, only the column structure is checked and the table is normalized (dtypes, sort,
+            categories). Used for tables read from the database, which are validated before being
+            written (default is True).
         
         Returns
         -------
@@ -761,20 +904,18 @@ class PVS_Impacts:
         ValueError
             Raised in the following cases:
             - Missing required columns: If any of the required columns are absent.
-            - Null values in 'impact_value': If the 'impact_value' column contains null values.
+            - Null values in mandatory columns: If the 'impact_value', 'motorization', 'description', or 'sources'
+              columns contain null values.
             - Invalid 'type' values: If the 'type' column contains values that are not defined in the `DCT_TYPE` dictionary.
             - Missing required keys: If any required keys from the `DCT_TYPE` dictionary are missing in the 'type' column, 
               excluding keys starting with "without" or "with".
             - Invalid 'impact_type': If the 'impact_type' column contains values that do not match the specified `self.impact_type`.
             - Inconsistent 'impact_unit': If the 'impact_unit' column contains multiple unique values.
-            - Null values in mandatory columns: If the 'motorization', 'description', or 'sources' columns contain null values.
             - Invalid 'max_distance' relationship:
                 - For types with a single row, 'max_distance' must be NaN.
                 - For types with multiple rows, 'max_distance' must have exactly one NaN, and all other values must be unique.
             - Duplicate ['type', 'impact_value'] pairs: If any duplicate pairs exist in the table.
         """
-        from transnetmap.utils.constant import DCT_TYPE
-        
         # Expected column structure
         required_columns = [
             "type", "max_distance", "impact_type", "impact_value", "impact_unit",
@@ -786,63 +927,87 @@ class PVS_Impacts:
         if missing_columns:
             raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
         
-        # Process data types
-        data["max_distance"] = pd.to_numeric(data["max_distance"], errors="coerce").astype("float32")
-        data["impact_value"] = pd.to_numeric(data["impact_value"], errors="coerce").astype("float32")     
-        data["load_percent"] = pd.to_numeric(data["load_percent"], errors="coerce").astype("float32")
-        
-        # Validate mandatory columns
-        if data["impact_value"].isnull().any():
-            raise ValueError("The 'impact_value' column contains null values, which are not allowed.")
-        if not data["type"].isin(list(DCT_TYPE.keys())).all():
-            raise ValueError("The 'type' column contains type values, which are not allowed.\n"
-                             "Types are defined in the `DCT_TYPE` dictionary."
-                             )
-        if not data["impact_type"].isin([self.impact_type]).all():
-            raise ValueError("The 'impact_type' column contains type values, which are not allowed.\n"
-                             f"All values must correspond to the type of impact defined: '{self.impact_type}'"
-                             )
-        if not data["impact_unit"].nunique() == 1:
-            raise ValueError("The 'impact_unit' column contains different values, they must be identical.")
-        
-        # Ensure all keys in DCT_TYPE (excluding 'without' and 'with' keys) are present in the 'type' column
-        required_keys = [key for key in DCT_TYPE.keys() if not key.startswith("extend") and not key.startswith("with")] # ("with" operate "without" to)
-        missing_keys = [key for key in required_keys if key not in data["type"].tolist()]
-        if missing_keys:
-            raise ValueError(f"The following keys from 'utils.constant.DCT_TYPE' are missing in the 'type' column: {', '.join(missing_keys)}")
-
-        # Ensure mandatory fields are filled
-        for col in ["motorization", "description", "sources"]:
-            if data[col].isnull().any():
-                raise ValueError(f"The '{col}' column contains null values, which are not allowed.")
-
-        # Validate 'type' and 'max_distance' relationship
-        grouped = data.groupby("type")["max_distance"]
-        
-        for type_name, group in grouped:
-            nan_count = group.isna().sum()
-            unique_distances = group.dropna().nunique()
+        # Process data types (numeric columns from the database are cast directly; strings from
+        # the CSV or objects are parsed with an error naming the column)
+        for col in ("max_distance", "impact_value", "load_percent"):
+            if data[col].dtype == "float32":
+                continue
+            if pd.api.types.is_numeric_dtype(data[col]):
+                data[col] = data[col].to_numpy(dtype=np.float32, na_value=np.nan)
+                continue
+            data[col] = _parse_float32_column(data[col].to_numpy(dtype=object), col)
+        
+        # Tables read back from the database were validated before being written, and their
+        # primary key on ('type', 'impact_value') is enforced by the database: only normalize them
+        if full:
+            # Ensure mandatory fields are filled (one null scan over the underlying array, no boolean frame)
+            mandatory_columns = ["impact_value", "motorization", "description", "sources"]
+            null_columns = pd.isna(data[mandatory_columns].to_numpy()).any(axis=0)
+            if null_columns.any():
+                raise ValueError("The following columns contain null values, which are not allowed: "
+                                 f"{', '.join(np.array(mandatory_columns)[null_columns])}")
             
-            if len(group) == 1:
-                if nan_count != 1:
-                    raise ValueError(f"For type '{type_name}', there should be exactly one row with NaN in 'max_distance'.")
-            else:
-                if nan_count != 1:
-                    raise ValueError(f"For type '{type_name}', there must be exactly one NaN value in 'max_distance' across multiple rows.")
-                if unique_distances != len(group) - 1:
-                    raise ValueError(f"For type '{type_name}', all non-NaN 'max_distance' values must be unique.")
-        
-        # Validate uniqueness of ["type", "impact_value"]
-        duplicate_pairs = data.duplicated(subset=["type", "impact_value"], keep=False)
-        if duplicate_pairs.any():
-            duplicate_rows = data.loc[duplicate_pairs, ["type", "impact_value"]]
-            raise ValueError(
-                f"Duplicate entries found for the following 'type' and 'impact_value' pairs:\n"
-                f"{duplicate_rows.to_string(index=False)}"
+            # Validate mandatory columns
+            present_types = set(data["type"].unique())
+            if not present_types.issubset(DCT_TYPE.keys()):
+                raise ValueError("The 'type' column contains type values, which are not allowed.\n"
+                                 "Types are defined in the `DCT_TYPE` dictionary."
+                                 )
+            if not (data["impact_type"].to_numpy() == self.impact_type).all():
+                raise ValueError("The 'impact_type' column contains type values, which are not allowed.\n"
+                                 f"All values must correspond to the type of impact defined: '{self.impact_type}'"
+                                 )
+            if not data["impact_unit"].nunique() == 1:
+                raise ValueError("The 'impact_unit' column contains different values, they must be identical.")
+            
+            # Ensure all keys in DCT_TYPE (excluding 'without' and 'with' keys) are present in the 'type' column
+            required_keys = {key for key in DCT_TYPE if not key.startswith(("extend", "with"))} # ("with" operate "without" to)
+            missing_keys = required_keys - present_types
+            if missing_keys:
+                raise ValueError(f"The following keys from 'utils.constant.DCT_TYPE' are missing in the 'type' column: {', '.join(sorted(missing_keys))}")
+
+            # Validate 'type' and 'max_distance' relationship (single pass over sorted runs of types)
+            type_codes, type_names = pd.factorize(data["type"])
+            run_codes, bad_single, bad_nan, bad_unique = _check_max_distance_runs(
+                type_codes, data["max_distance"].to_numpy(dtype=np.float32)
             )
+            
+            if bad_single.any():
+                raise ValueError(f"For type(s) {sorted(type_names[run_codes[bad_single]])}, "
+                                 "there should be exactly one row with NaN in 'max_distance'.")
+            if bad_nan.any():
+                raise ValueError(f"For type(s) {sorted(type_names[run_codes[bad_nan]])}, "
+                                 "there must be exactly one NaN value in 'max_distance' across multiple rows.")
+            if bad_unique.any():
+                raise ValueError(f"For type(s) {sorted(type_names[run_codes[bad_unique]])}, "
+                                 "all non-NaN 'max_distance' values must be unique.")
+            
+            # Validate uniqueness of ["type", "impact_value"]: both are packed into one uint64 key per row
+            # (type code in the high 32 bits, float32 bit pattern in the low 32 bits; '+ 0' folds -0.0 into 0.0)
+            value_bits = (data["impact_value"].to_numpy(dtype=np.float32) + np.float32(0)).view(np.uint32)
+            keys = (type_codes.astype(np.uint64) << np.uint64(32)) | value_bits.astype(np.uint64)
+            _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+            duplicate_pairs = counts[inverse] > 1
+            if duplicate_pairs.any():
+                # Report at most 20 rows to keep the message bounded
+                duplicate_rows = data.loc[duplicate_pairs, ["type", "impact_value"]].head(20)
+                extra = int(duplicate_pairs.sum()) - len(duplicate_rows)
+                suffix = f"\n... ({extra} more)" if extra > 0 else ""
+                raise ValueError(
+                    f"Duplicate entries found for the following 'type' and 'impact_value' pairs:\n"
+                    f"{duplicate_rows.to_string(index=False)}{suffix}"
+                )
+            
+        # Low-cardinality labels are stored as categories (free-text columns are kept as is)
+        for col in ("type", "impact_type", "impact_unit", "motorization"):
+            data[col] = data[col].astype("category")
         
-        # Sort by type and max_distance, placing NaN last
-        data = data.sort_values(by=['type','max_distance'], na_position='last')
+        # Sort by type (category codes follow the sorted labels) and max_distance, placing NaN last
+        order = np.lexsort((
+            data["max_distance"].fillna(np.inf).to_numpy(),
+            data["type"].cat.codes.to_numpy(),
+        ))
+        data = data.iloc[order].reset_index(drop=True)
         
         return data
 
@@ -874,6 +1039,7 @@ class PVS_Impacts:
         - The 'name' column is used as the primary key.
         - The table is created in the 'physical_values' schema.
         - The method uses SQLAlchemy for database interaction and supports PostgreSQL.
+        - Rows are bulk-loaded with PostgreSQL ``COPY ... FROM STDIN`` (the table itself is created by pandas).
         - Each row in the table corresponds to a specific physical parameter for impacts calculations.
         
         Returns
@@ -886,10 +1052,6 @@ class PVS_Impacts:
         >>> pvs_impacts_co2.read_csv("physical_values_impacts_CO2_1.csv")
         >>> pvs_impacts_co2.to_sql(if_exists='replace')
         """
-        from sqlalchemy import create_engine
-        from sqlalchemy.dialects.postgresql import VARCHAR, TEXT, REAL
-        from transnetmap.utils.sql import define_schema, schema_exists, execute_primary_key_script
-        
         # Prohibit "append" to avoid data duplication issues
         if if_exists == 'append':
             raise ValueError(
@@ -910,13 +1072,14 @@ class PVS_Impacts:
         
         # Write to the database
         try:
-            with create_engine(self.uri, echo=self.sql_echo).connect() as connection:
+            with self.engine.connect() as connection:
                 self.table.to_sql(
                     table_name,
                     connection,
                     schema=schema,
                     if_exists=if_exists,
                     index=False,
+                    method=insert_copy_from,
                     dtype={
                         'type': VARCHAR,
                         'max_distance': REAL,
@@ -932,6 +1095,9 @@ class PVS_Impacts:
                 )
         except Exception as e:
             raise RuntimeError(f"An error occurred while writing to the database: {e}")
+        finally:
+            # The write may have replaced the table: drop cached existence answers
+            invalidate_exists_cache(self.uri)
         
         # add primary key to table
         execute_primary_key_script(
@@ -940,7 +1106,8 @@ class PVS_Impacts:
             list_columns=["type", "impact_value"],
             schema=schema,
             include_schema_in_pk_name=False,
-            print_status=self.main_print
+            print_status=self.main_print,
+            validate=False,  # Table just written
         )
 
         self._log(f"Writing to the database is successful. Table: '{schema}.{table_name}'")
@@ -954,7 +1121,7 @@ class PVS_Impacts:
         -------
         PVS_Impacts
             The current instance with the table loaded into the 'self.table' attribute as a DataFrame.
-            The table is also validated and processed.
+            The table is also processed (dtypes, sort and categories).
 
         Raises
         ------
@@ -963,9 +1130,6 @@ class PVS_Impacts:
         ValueError
             If the data format is invalid or the validation fails.
         """
-        from transnetmap.utils.sql import table_exists
-        from sqlalchemy import create_engine
-
         # Define schema and table name
         schema = self.schema
         table_name = self.table_name
@@ -976,22 +1140,22 @@ class PVS_Impacts:
                 f'Ensure it is defined and written to the database (schema: "{schema}").'
             )
             
-        sql_query = f'SELECT * FROM "{schema}"."{table_name}"'
+        # Read through SQLAlchemy table reflection (identifiers are quoted by the dialect)
         try:
-            with create_engine(self.uri, echo=self.sql_echo).connect() as connection:
-                data = pd.read_sql_query(sql_query, connection)
+            with self.engine.connect() as connection:
+                data = pd.read_sql_table(table_name, connection, schema=schema, coerce_float=False)
         except Exception as e:
             raise RuntimeError(f"Error reading data from database: {e}")
         
-        # Validate and process the table
-        self.table = self._validate_and_process_table(data)
+        # Process the table (already validated before being written to the database)
+        self.table = self._validate_and_process_table(data, full=False)
 
         self._log(f"Import from database successful. Table: '{schema}.{table_name}'")
         
         return self
 
 
-    def read_csv(self, file: Union[str, Path]) -> PVS_Impacts:
+    def read_csv(self, file: Union[str, Path], *, use_cache: bool = False) -> PVS_Impacts:
         """
         Reads a physical value set (PVS) from a CSV file and validates its format.
         
@@ -1028,6 +1192,11 @@ class PVS_Impacts:
         ----------
         file : str or pathlib.Path
             Path to the CSV file.
+        use_cache : bool, optional
+            If True, the validated table is cached as a Parquet file next to the CSV
+            (same name, ``.parquet`` suffix) and reloaded from it, skipping parsing and
+            validation, as long as the CSV keeps the exact size and modification time it
+            had when the cache was written (default is False).
         
         Returns
         -------
@@ -1045,6 +1214,9 @@ class PVS_Impacts:
         - The method ensures that the CSV file adheres to strict structural and content requirements.
         - Missing values for `'max_distance'` and `'load_percent'` are automatically converted to `NaN` for processing.
         - The validated data is stored in the `self.table` attribute for further operations.
+        - The Parquet cache (``use_cache=True``) preserves dtypes, including categories. If it
+          cannot be written (e.g. read-only directory), a warning is issued and the validated
+          table is still loaded.
         
         Examples
         --------
@@ -1056,22 +1228,46 @@ class PVS_Impacts:
         1       PT           4.0         CO2         0.55  kg / seat-km     average      ...
         2  NTS-main           NaN         CO2         0.34  kg / seat-km     electric     ...
         """
-        from transnetmap.utils.utils import validate_input_file_name
-        
         # Validate file name format
         file_str_valid = f'{self.schema}_{self._type}_{self.impact_type}_{self.physical_values_set_number}.csv'
-        validate_input_file_name(file, file_str_valid)
+        file = validate_input_file_name(file, file_str_valid)
         
-        # Load CSV
+        # Reuse the validated table cached from a previous load of the same (unchanged) CSV
+        cache_path = file.with_suffix('.parquet')
+        if use_cache:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            
+            fingerprint = _csv_fingerprint(file)
+            try:
+                cached_source = (pq.read_schema(cache_path).metadata or {}).get(_CACHE_SOURCE_KEY)
+            except (OSError, ValueError):  # No cache yet, or unreadable: rebuilt below
+                cached_source = None
+            if cached_source == fingerprint:
+                self.table = pq.read_table(cache_path).to_pandas()
+                self._log(f"Validated table loaded from cache: '{cache_path}'")
+                return self
+        
+        # Load CSV (numeric columns are read as strings and parsed during validation, so that
+        # a non-numeric value is reported with its column; '-' marks a missing value)
         try:
-           data = pd.read_csv(
-               file, sep=';', dtype=str
-           )
+            data = pd.read_csv(file, sep=';', engine='c', dtype=str)
         except Exception as e:
-           raise ValueError(f"Error reading CSV file: {str(e)}")
+            raise ValueError(f"Error reading CSV file: {str(e)}")
 
         # Validate and process the table
         self.table = self._validate_and_process_table(data)
+        
+        if use_cache:
+            # The fingerprint read before parsing is stored, so a CSV edited meanwhile is re-read next time
+            arrow_table = pa.Table.from_pandas(self.table, preserve_index=False)
+            arrow_table = arrow_table.replace_schema_metadata(
+                {**(arrow_table.schema.metadata or {}), _CACHE_SOURCE_KEY: fingerprint}
+            )
+            try:
+                pq.write_table(arrow_table, cache_path, compression="zstd")
+            except OSError as e:
+                warnings.warn(f"Could not write the Parquet cache '{cache_path}': {e}", RuntimeWarning, stacklevel=2)
             
         return self
 
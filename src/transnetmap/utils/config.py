@@ -17,17 +17,160 @@ Notes
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Union
-from urllib.parse import urlparse
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple, Union
 
 __all__ = ["ParamConfig", "HeatMapConfig"]
 
 
+# -----------------------------------------------------------------------------
+# Validation helpers
+# -----------------------------------------------------------------------------
+_TYPE_MAP: Mapping[str, Tuple[type, ...]] = MappingProxyType({
+    "network_number": (int, type(None)),
+    "physical_values_set_number": (int, type(None)),
+    "network_extension_type": (str, type(None)),
+    "db_nptm_schema": (str, type(None)),
+    "db_zones_table": (str, type(None)),
+    "db_imt_table": (str, type(None)),
+    "db_pt_table": (str, type(None)),
+    "uri": (str,),
+    "main_print": (bool,),
+    "sql_echo": (bool,),
+})
+""" Accepted types for each ``ParamConfig`` field (read-only). """
+
+_VALID_EXT_TYPES: FrozenSet[str] = frozenset({"IMT", "PT"})
+""" Accepted values for ``ParamConfig.network_extension_type`` (``None`` is handled upstream). """
+
+_URI_PREFIX = "postgresql://"
+
+# [user[:password]@]host[:port][/database], matched right after the prefix.
+# Every part is optional here so that each missing one gets its own error message.
+_URI_RE = re.compile(
+    r"(?:[^/?#]*@)?"
+    r"(?P<host>\[[^\]/?#]*\]|[^:/?#]*)"
+    r"(?::(?P<port>[^/?#]*))?"
+    r"(?P<path>/[^?#]*)?",
+    re.ASCII,
+)
+""" Single-pass parser for the restricted PostgreSQL URI grammar (ASCII by construction). """
+
+
+@lru_cache(maxsize=64)
+def _fields_getter(field_names: Tuple[str, ...]):
+    """
+    Return a callable fetching ``field_names`` from an object as a tuple.
+
+    Built once per distinct field tuple on top of ``operator.attrgetter``, which
+    collects every attribute in a single C-level call.
+    """
+    getter = attrgetter(*field_names)
+    if len(field_names) == 1:
+        return lambda obj: (getter(obj),)
+    return getter
+
+
+@lru_cache(maxsize=32)
+def _make_validator(required_fields: Tuple[str, ...]) -> Callable[[ParamConfig], None]:
+    """
+    Generate a validator specialized for ``required_fields``.
+
+    For each field, the generated function inlines one attribute access, a
+    ``None`` check (missing value) and an ``isinstance`` check, with no type-map
+    lookup or loop at call time. It is built once per distinct field tuple.
+
+    Parameters
+    ----------
+    required_fields : tuple of str
+        Field names to check.
+
+    Raises
+    ------
+    KeyError
+        If a field name is not a key of ``_TYPE_MAP``.
+    """
+    namespace: Dict[str, Any] = {}
+    lines = ["def _validate(obj):"]
+    for i, field_name in enumerate(required_fields):
+        try:
+            expected_types = _TYPE_MAP[field_name]
+        except KeyError:
+            raise KeyError(f"Field '{field_name}' is not recognized in type_map.") from None
+        namespace[f"_t{i}"] = expected_types
+        namespace[f"_n{i}"] = f"Required parameter '{field_name}' is missing."
+        namespace[f"_m{i}"] = f"Parameter '{field_name}' must be of type {expected_types}, got "
+        lines.append(f"    value = obj.{field_name}")
+        lines.append("    if value is None:")
+        lines.append(f"        raise ValueError(_n{i})")
+        lines.append(f"    if not isinstance(value, _t{i}):")
+        lines.append(f"        raise TypeError(_m{i} + type(value).__name__ + '.')")
+    lines.append("    return None")
+
+    exec("\n".join(lines), namespace)
+    return namespace["_validate"]
+
+
+@lru_cache(maxsize=128)
+def _parse_uri(uri: str) -> Tuple[str, int, str]:
+    """
+    Parse and validate a PostgreSQL connection string.
+
+    Cached on the URI string: a pipeline usually reuses the same URI for every
+    class, so the regex only runs once per distinct value. Failures raise and
+    are therefore never cached.
+
+    Returns
+    -------
+    Tuple[str, int, str]
+        Hostname, port and database name.
+
+    Raises
+    ------
+    ValueError
+        If the scheme, hostname, port or database name is missing or invalid.
+    """
+    # Cheap prefix test first: obviously wrong URIs never reach the regex
+    if not uri.startswith(_URI_PREFIX):
+        raise ValueError("The 'uri' must start with 'postgresql://'.")
+
+    # Validate the host, port and database
+    match = _URI_RE.match(uri, len(_URI_PREFIX))
+    if match["host"] in ("", "[]"):
+        raise ValueError("The 'uri' must include a valid hostname.")
+    port = match["port"]
+    if not (port and port.isascii() and port.isdigit()) or not 0 < int(port) <= 65535:
+        raise ValueError("The 'uri' must include a valid port.")
+    if not match["path"] or match["path"] == "/":
+        raise ValueError("The 'uri' must include a database name in the path.")
+
+    return match["host"], int(port), match["path"][1:]
+
+
 # -----------------------------------------------------------------------------
 # ParamConfig
 # -----------------------------------------------------------------------------
-@dataclass
+_PARAM_DESCRIBE_TPL = (
+    "\nParamConfig (network settings):\n"
+    " - Network number           : {self.network_number}\n"
+    " - Physical value set       : {self.physical_values_set_number}\n"
+    " - Extension type           : {self.network_extension_type}\n"
+    " - Schema (NPTM)            : {self.db_nptm_schema}\n"
+    " - Table (zones)            : {self.db_zones_table}\n"
+    " - Table (IMT)              : {self.db_imt_table}\n"
+    " - Table (PT)               : {self.db_pt_table}\n"
+    " - PostgreSQL URI           : {self.uri}\n"
+    " - SQL Echo                 : {self.sql_echo}\n"
+    " - Print summary            : {self.main_print}"
+)
+""" Output template of ``ParamConfig.describe()``. """
+
+
+@dataclass(frozen=True, eq=True, slots=True)
 class ParamConfig:
     """
     Base configuration class for handling parameters across all transnetmap classes,
@@ -41,6 +184,14 @@ class ParamConfig:
     with ``**param`` so that keys map to dataclass fields. In contrast, transnetmap
     classes accept either a ``dict`` or an existing ``ParamConfig`` and will handle
     conversion/validation internally.
+
+    Instances are frozen and hashable, so they can be shared safely between classes
+    and used as cache keys. Use ``dataclasses.replace(config, ...)`` to derive a
+    modified copy.
+
+    The URI and network extension type are validated at construction time, so an
+    invalid ``ParamConfig`` cannot exist. Required fields depend on the consuming
+    class and are checked by ``validate(required_fields)``.
     
     Examples
     --------
@@ -55,8 +206,8 @@ class ParamConfig:
     ...         
     ...         # Case 1: param is a dictionary
     ...         if isinstance(param, dict):
-    ...         self.config = ParamConfig(**param, required_fields=required_fields)
-    ...         self.config.validate()
+    ...         self.config = ParamConfig(**param)
+    ...         self.config.validate(required_fields)
     ...         
     ...         # Case 2: param is already a ParamConfig
     ...         elif isinstance(param, ParamConfig):
@@ -143,11 +294,6 @@ class ParamConfig:
         to the console.
         
         Primarily useful for debugging database interactions.
-        
-    required_fields : List[str]
-        List of field names that are required for validation.
-        
-        This is set dynamically in the context of each class that uses `ParamConfig`.
     """
 
     # Global parameters (common to all classes)
@@ -162,55 +308,59 @@ class ParamConfig:
     main_print: bool = False  # Toggles general execution information in the console.
     sql_echo: bool = False  # Toggles SQL logging for debugging database interactions.
 
-    # Custom field validation (e.g., required fields)
-    required_fields: List[str] = field(default_factory=list)  # Dynamically set in each class.
+    # Required fields already validated on this (frozen) instance, None if never validated
+    _validated: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Check formats (URI, extension type) eagerly; required fields are checked by each class
+        self.validate()
 
-    def validate(self) -> ParamConfig:
+    def validate(self, required_fields: Optional[Sequence[str]] = ()) -> ParamConfig:
         """
         Validate that all required fields are provided and check complex formats.
+
+        Successful validations are memoized on the instance (frozen, so its values
+        cannot change afterwards), so re-validating the same configuration is nearly free.
+
+        Parameters
+        ----------
+        required_fields : sequence of str, optional
+            Field names that must be set and of the expected type. Set dynamically
+            in the context of each class that uses `ParamConfig`.
+
+        Returns
+        -------
+        ParamConfig
+            The validated instance itself.
         """
-        # Validate required fields
-        for field_name in self.required_fields:
-            if getattr(self, field_name) is None:
-                raise ValueError(f"Required parameter '{field_name}' is missing.")
+        required_fields = tuple(required_fields or ())
+        if self._validated is not None and self._validated.issuperset(required_fields):
+            return self
 
-        # Check parameter types
-        self._validate_types()
+        # Check presence and type of the required fields in a single pass
+        self._validate_required_fields(required_fields)
 
         # Validate specific fields
         self._validate_uri()  # Validate the uri string for database
         self._validate_network_extension_type()  # Validate the network extension type
 
+        self._mark_validated(required_fields)
         return self
 
-    def _validate_types(self) -> None:
+    def _mark_validated(self, required_fields: Tuple[str, ...]) -> None:
         """
-        Explicitly validate types for each field.
+        Record on the instance that ``required_fields`` passed validation.
         """
-        type_map = {
-            "network_number": (int, type(None)),
-            "physical_values_set_number": (int, type(None)),
-            "network_extension_type": (str, type(None)),
-            "db_nptm_schema": (str, type(None)),
-            "db_zones_table": (str, type(None)),
-            "db_imt_table": (str, type(None)),
-            "db_pt_table": (str, type(None)),
-            "uri": (str,),
-            "main_print": (bool,),
-            "sql_echo": (bool,),
-        }
-
-        # Validate types only for fields in required_fields
-        for field_name in self.required_fields:
-            value = getattr(self, field_name)
-            expected_types = type_map.get(field_name, None)
-
-            if expected_types is None:
-                raise KeyError(f"Field '{field_name}' is not recognized in type_map.")
-            if not isinstance(value, expected_types):
-                raise TypeError(
-                    f"Parameter '{field_name}' must be of type {expected_types}, got {type(value).__name__}."
-                )
+        validated = frozenset(required_fields)
+        if self._validated is not None:
+            validated |= self._validated
+        object.__setattr__(self, "_validated", validated)
+
+    def _validate_required_fields(self, required_fields: Tuple[str, ...]) -> None:
+        """
+        Check that each required field is set and of the expected type.
+        """
+        _make_validator(required_fields)(self)
 
     def _validate_uri(self) -> None:
         """
@@ -219,18 +369,7 @@ class ParamConfig:
         if not self.uri:
             return  # Skip validation if URI is not required
 
-        # Parse the URI using urlparse
-        parsed_uri = urlparse(self.uri)
-
-        # Validate the scheme, host, and port
-        if parsed_uri.scheme != "postgresql":
-            raise ValueError("The 'uri' must start with 'postgresql://'.")
-        if not parsed_uri.hostname:
-            raise ValueError("The 'uri' must include a valid hostname.")
-        if not parsed_uri.port:
-            raise ValueError("The 'uri' must include a valid port.")
-        if not parsed_uri.path or parsed_uri.path == "/":
-            raise ValueError("The 'uri' must include a database name in the path.")
+        _parse_uri(self.uri)
 
     def _validate_network_extension_type(self) -> None:
         """
@@ -239,7 +378,7 @@ class ParamConfig:
         if not self.network_extension_type:
             return  # Skip validation if network_extension_type is not required
 
-        if self.network_extension_type not in {'IMT', 'PT', None}:
+        if self.network_extension_type not in _VALID_EXT_TYPES:
             raise ValueError(
                 f"Invalid 'network_extension_type': {self.network_extension_type}\n"
                 "It must be one of: 'IMT', 'PT', or None."
@@ -259,7 +398,18 @@ class ParamConfig:
         ValueError
             If any required field is missing.
         """
-        missing_fields = [field for field in required_fields if getattr(self, field, None) is None]
+        required_fields = tuple(required_fields)
+        if not required_fields:
+            return
+        if self._validated is not None and self._validated.issuperset(required_fields):
+            return  # Already checked by validate(), and the instance is frozen
+        try:
+            values = _fields_getter(required_fields)(self)
+        except AttributeError:
+            # Unknown field names are reported as missing
+            values = tuple(getattr(self, name, None) for name in required_fields)
+
+        missing_fields = [name for name, value in zip(required_fields, values) if value is None]
         if missing_fields:
             raise ValueError(f"Missing required parameters: {', '.join(missing_fields)}")
 
@@ -269,23 +419,84 @@ class ParamConfig:
 
         Includes parameters such as network number, schema/table names, and connection URI.
         """
-        print("\nParamConfig (network settings):")
-        print(f" - Network number           : {self.network_number}")
-        print(f" - Physical value set       : {self.physical_values_set_number}")
-        print(f" - Extension type           : {self.network_extension_type}")
-        print(f" - Schema (NPTM)            : {self.db_nptm_schema}")
-        print(f" - Table (zones)            : {self.db_zones_table}")
-        print(f" - Table (IMT)              : {self.db_imt_table}")
-        print(f" - Table (PT)               : {self.db_pt_table}")
-        print(f" - PostgreSQL URI           : {self.uri}")
-        print(f" - SQL Echo                 : {self.sql_echo}")
-        print(f" - Print summary            : {self.main_print}")
+        print(_PARAM_DESCRIBE_TPL.format(self=self))
 
 
 # -----------------------------------------------------------------------------
 # HeatMapConfig
 # -----------------------------------------------------------------------------
-@dataclass
+# Default prototypes, copied per instance because `HeatMap` updates them in place.
+# Never mutate these module-level dicts directly.
+_DEFAULT_MAP_TILES: Tuple[str, ...] = ("CartoDB Voyager", "OpenStreetMap")
+
+_DEFAULT_THRESHOLDS_SCALE: Dict[str, Dict[str, Any]] = {
+    "time": {"scale": None, "fill_color": None, "reverse_color": None},
+    "length": {"scale": None, "fill_color": None, "reverse_color": None},
+    "changes": {"scale": None, "fill_color": None, "reverse_color": None},
+    "transport_type": {"scale": None, "fill_color": None, "reverse_color": None},
+    "impacts": {"fill_color": None, "reverse_color": None},       # Placeholder for all impacts
+    "difference": {"fill_color": None, "reverse_color": None},    # Placeholder for all differences
+}
+
+_DEFAULT_CHOROPLETH_STYLE: Dict[str, Union[str, float, int, bool]] = {
+    "fill_opacity": 0.8,     # Transparency of filled areas
+    "line_color": "black",   # Border color
+    "line_weight": 1,        # Border thickness
+    "line_opacity": 0.2,     # Transparency of borders
+    "smooth_factor": 1,      # Controls smoothing of geometries
+    "overlay": True,         # Determines if the layer is an overlay
+    "control": True,         # Determines if the layer appears in LayerControls
+    "show": False,           # Default visibility of the layer
+}
+
+_DEFAULT_POPUP_STYLE: Dict[str, Any] = {
+    "name": "Data popup",  # Name of the layer
+    "overlay": True,       # Determines if the layer is an overlay
+    "control": True,       # Determines if the layer appears in LayerControls
+    "show": False,         # Default visibility of the layer
+    "html_fields": "color: #333333; font-family: arial; font-size: 11px; padding: 10px;",
+}
+
+_DEFAULT_POPUP_GEODATA_STYLE: Dict[str, Any] = {
+    "fillColor": "#ffffff",
+    "color": "#000000",
+    "fillOpacity": 0.1,
+    "weight": 0.1,
+}
+
+_DEFAULT_POPUP_GEODATA_HIGHLIGHT: Dict[str, Any] = {
+    "fillColor": "#000000",
+    "color": "#000000",
+    "fillOpacity": 0.3,
+    "weight": 0.1,
+}
+
+_HEATMAP_DESCRIBE_TPL = (
+    "\nHeatMapConfig:\n"
+    " - file_name             : {self.file_name}\n"
+    " - save_to_desktop       : {self.save_to_desktop}\n"
+    " - custom_path           : {custom_path}\n"
+    " - open_browser          : {self.open_browser}\n"
+    " - include_stations      : {self.include_stations}\n"
+    " - include_network_layers: {self.include_network_layers}\n"
+    " - map_tiles             : {map_tiles}\n"
+    " - zoom_start            : {self.zoom_start}\n"
+    " - fallback location     : {location}\n"
+    " - popup_fields          : {self.popup_fields}\n"
+    " - data_source_note      : {data_source_note}\n"
+    " - thresholds_scale keys : {thresholds_keys}\n"
+    "\nThresholds:\n"
+    "   - Threshold scales (`scale`) are computed automatically by `generate_map()` if left as `None`.\n"
+    "   - You can override them here to use fixed thresholds per analysis type.\n"
+    "\nDefault colors:\n"
+    "   - Default `fill_color` values for each analysis type are stored in:\n"
+    "     `transnetmap.utils.constant.DEFAULT_THRESHOLDS_SCALE_COLOR`\n"
+    "\nStyling keys follow Folium API. See: https://python-visualization.github.io/folium/"
+)
+""" Output template of ``HeatMapConfig.describe()``. """
+
+
+@dataclass(slots=True)
 class HeatMapConfig:
     """
     Configuration container for heatmap generation.
@@ -310,8 +521,8 @@ class HeatMapConfig:
     ----------
     data_source_note : Optional[str]
         Optional free-text note (e.g., data sources). Displayed in the info box on the map.
-    map_tiles : List[str]
-        List of tile providers to include on the map.
+    map_tiles : Tuple[str, ...]
+        Tile providers to include on the map (any sequence of names is accepted).
     zoom_start : int or None
         Initial zoom level of the map. If ``None``, uses auto-fit.
     location : Optional[Tuple[float, float]]
@@ -356,7 +567,7 @@ class HeatMapConfig:
 
     # General settings
     data_source_note: Optional[str] = None  # Appears in top-left map box
-    map_tiles: List[str] = field(default_factory=lambda: ["CartoDB Voyager", "OpenStreetMap"])
+    map_tiles: Sequence[str] = _DEFAULT_MAP_TILES
     zoom_start: int = None
     location: Optional[Tuple[float, float]] = None  # Auto-fit if None
     file_name: Optional[str] = "heatmap"
@@ -368,59 +579,19 @@ class HeatMapConfig:
 
     # Choropleth settings
     thresholds_scale: Dict[str, Dict[str, Union[List[float], str, bool]]] = field(
-        default_factory=lambda: {
-            "time": {"scale": None, "fill_color": None, "reverse_color": None},
-            "length": {"scale": None, "fill_color": None, "reverse_color": None},
-            "changes": {"scale": None, "fill_color": None, "reverse_color": None},
-            "transport_type": {"scale": None, "fill_color": None, "reverse_color": None},
-            "impacts": {"fill_color": None, "reverse_color": None},       # Placeholder for all impacts
-            "difference": {"fill_color": None, "reverse_color": None},    # Placeholder for all differences
-        }
+        default_factory=lambda: {k: v.copy() for k, v in _DEFAULT_THRESHOLDS_SCALE.items()}
     )
 
     choropleth_style: Dict[str, Union[str, float, int, bool]] = field(
-        default_factory=lambda: {
-            "fill_opacity": 0.8,     # Transparency of filled areas
-            "line_color": "black",   # Border color
-            "line_weight": 1,        # Border thickness
-            "line_opacity": 0.2,     # Transparency of borders
-            "smooth_factor": 1,      # Controls smoothing of geometries
-            "overlay": True,         # Determines if the layer is an overlay
-            "control": True,         # Determines if the layer appears in LayerControls
-            "show": False,           # Default visibility of the layer
-        }
+        default_factory=_DEFAULT_CHOROPLETH_STYLE.copy
     )
 
     # Popup settings
     popup_fields: Union[List[str], bool] = None  # Defines which columns to include in popups (with aliases).
 
-    popup_style: Dict[str, Any] = field(
-        default_factory=lambda: {
-            "name": "Data popup",  # Name of the layer
-            "overlay": True,       # Determines if the layer is an overlay
-            "control": True,       # Determines if the layer appears in LayerControls
-            "show": False,         # Default visibility of the layer
-            "html_fields": "color: #333333; font-family: arial; font-size: 11px; padding: 10px;",
-        }
-    )
-
-    popup_geodata_style: Dict[str, Any] = field(
-        default_factory=lambda: {
-            "fillColor": "#ffffff",
-            "color": "#000000",
-            "fillOpacity": 0.1,
-            "weight": 0.1,
-        }
-    )
-
-    popup_geodata_highlight: Dict[str, Any] = field(
-        default_factory=lambda: {
-            "fillColor": "#000000",
-            "color": "#000000",
-            "fillOpacity": 0.3,
-            "weight": 0.1,
-        }
-    )
+    popup_style: Dict[str, Any] = field(default_factory=_DEFAULT_POPUP_STYLE.copy)
+    popup_geodata_style: Dict[str, Any] = field(default_factory=_DEFAULT_POPUP_GEODATA_STYLE.copy)
+    popup_geodata_highlight: Dict[str, Any] = field(default_factory=_DEFAULT_POPUP_GEODATA_HIGHLIGHT.copy)
 
     def describe(self) -> None:
         """
@@ -428,29 +599,14 @@ class HeatMapConfig:
 
         Includes map behavior options, export settings, and data field controls.
         """
-        print("\nHeatMapConfig:")
-        print(f" - file_name             : {self.file_name}")
-        print(f" - save_to_desktop       : {self.save_to_desktop}")
-        print(f" - custom_path           : {self.custom_path or 'None'}")
-        print(f" - open_browser          : {self.open_browser}")
-        print(f" - include_stations      : {self.include_stations}")
-        print(f" - include_network_layers: {self.include_network_layers}")
-        print(f" - map_tiles             : {self.map_tiles}")
-        print(f" - zoom_start            : {self.zoom_start}")
-        print(f" - fallback location     : {self.location or 'Auto-fit'}")
-        print(f" - popup_fields          : {self.popup_fields}")
-        print(f" - data_source_note      : {self.data_source_note or 'None'}")
-        print(f" - thresholds_scale keys : {list(self.thresholds_scale.keys())}")
-
-        print("\nThresholds:")
-        print("   - Threshold scales (`scale`) are computed automatically by `generate_map()` if left as `None`.")
-        print("   - You can override them here to use fixed thresholds per analysis type.")
-
-        print("\nDefault colors:")
-        print("   - Default `fill_color` values for each analysis type are stored in:")
-        print("     `transnetmap.utils.constant.DEFAULT_THRESHOLDS_SCALE_COLOR`")
-
-        print("\nStyling keys follow Folium API. See: https://python-visualization.github.io/folium/")
+        print(_HEATMAP_DESCRIBE_TPL.format(
+            self=self,
+            custom_path=self.custom_path or "None",
+            map_tiles=list(self.map_tiles),
+            location=self.location or "Auto-fit",
+            data_source_note=self.data_source_note or "None",
+            thresholds_keys=list(self.thresholds_scale.keys()),
+        ))
 
 
 # -----------------------------------------------------------------------------
@@ -475,10 +631,10 @@ if __name__ == "__main__":
     required_fields = ["network_number", "main_print", "network_extension_type"]
 
     # Create a ParamConfig instance
-    config_net = ParamConfig(**dct_param, required_fields=required_fields)
+    config_net = ParamConfig(**dct_param)
 
     # Validate parameters
-    config_net.validate()
+    config_net.validate(required_fields)
     config_net.describe()
 
     # HeatMap configuration example
@@ -8,17 +8,20 @@ This module centralizes:
 - transport and level enumerations (``DCT_TYPE``, ``DCT_LEVEL``).
 - default UI/tiles lookups.
 - default color/scale choices for heatmaps.
-- and a helper to derive level → type mapping.
+- and a helper to derive level → type mapping (precomputed as ``LEVEL_TO_TYPE``).
 
 Notes
 -----
 * Keys of ``DCT_TYPE`` and ``DCT_LEVEL`` are part of the public contract.
+* Lookup tables are read-only views (``types.MappingProxyType``): they are shared
+  by the whole package and must not be modified at runtime.
 * ``IMPACTS`` may be extended in a future version via a public setter.
 """
 
 from __future__ import annotations
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import List, Mapping
 
 __all__ = [
     "IMPACTS",
@@ -27,6 +30,9 @@ __all__ = [
     "STATIONS_AREAS_RADIUS",
     "DCT_VALID_TILES",
     "DEFAULT_THRESHOLDS_SCALE_COLOR",
+    "LEVEL_TO_TYPE",
+    "DCT_TYPE_INV",
+    "DCT_LEVEL_INV",
 ]
 
 
@@ -47,7 +53,7 @@ Can be modified and supplemented from the source code. """
 # It is essential that the dictionary "DCT_TYPE" keys remain unchanged.
 # The ‘NTS’ prefix / suffix => New Transportation System
 # Values are used in DB column "type"
-DCT_TYPE: Dict[str, int] = {
+DCT_TYPE: Mapping[str, int] = MappingProxyType({
     "IMT": 1,
     "withoutIMT": -1,
     "PT": 2,
@@ -57,7 +63,7 @@ DCT_TYPE: Dict[str, int] = {
     "NTS-higher": 5,
     "with-NTS": 6,
     "extend-NTS": 7,
-}
+})
 """ Integer code for transport types/modes.
 Values are used in DB column 'type'.  
 The ‘NTS’ prefix / suffix => New Transportation System """
@@ -65,26 +71,26 @@ The ‘NTS’ prefix / suffix => New Transportation System """
 # ------------------------------------------------------------------
 # It is essential that the dictionary "DCT_LEVEL" keys remain unchanged.
 # Values are used in DB column "level"
-DCT_LEVEL: Dict[str, int] = {
+DCT_LEVEL: Mapping[str, int] = MappingProxyType({
     "lower": 1,
     "main": 2,
     "higher": 3,
-}
+})
 """ Integer code for the levels of the new transport system.  
 Values are used in DB column 'level'. """
 
 # Radius, in meters, of stations for displaying "station circles". Used in Network.show()
-STATIONS_AREAS_RADIUS = {
+STATIONS_AREAS_RADIUS: Mapping[int, float] = MappingProxyType({
     1: 5e3,
     2: 10e3,
     3: 30e3,
-}
+})
 """ Radius, in meters, of stations for displaying "station circles".  
 Used in Network.show()"""
 
 
 # Valid Folium tile providers (keys are the public names exposed to users)
-DCT_VALID_TILES = {
+DCT_VALID_TILES: Mapping[str, str] = MappingProxyType({
     "OpenStreetMap": "OpenStreetMap",
     "OpenStreetMap Mapnik": "OpenStreetMap Mapnik",
     "OpenStreetMap CH": "OpenStreetMap CH",
@@ -107,19 +113,19 @@ DCT_VALID_TILES = {
     "SwissFederalGeoportal NationalMapColor": "SwissFederalGeoportal NationalMapColor",
     "SwissFederalGeoportal NationalMapGrey": "SwissFederalGeoportal NationalMapGrey",
     "SwissFederalGeoportal SWISSIMAGE": "SwissFederalGeoportal SWISSIMAGE",
-}
+})
 """ Valid Folium tile providers (keys are the public names exposed to users). """
 
 
 # HeatMap defaults by analysis type
-DEFAULT_THRESHOLDS_SCALE_COLOR = {
-    "time": {"fill_color": "Paired", "reverse_color": False},
-    "length": {"fill_color": "Paired", "reverse_color": False},
-    "changes": {"fill_color": "RdYlGn", "reverse_color": True},         # Discrete
-    "transport_type": {"fill_color": "GnBu", "reverse_color": False},   # Discrete
-    "difference": {"fill_color": "plasma", "reverse_color": False},
-    "impacts": {"fill_color": "Spectral", "reverse_color": True},
-}
+DEFAULT_THRESHOLDS_SCALE_COLOR: Mapping[str, Mapping[str, object]] = MappingProxyType({
+    "time": MappingProxyType({"fill_color": "Paired", "reverse_color": False}),
+    "length": MappingProxyType({"fill_color": "Paired", "reverse_color": False}),
+    "changes": MappingProxyType({"fill_color": "RdYlGn", "reverse_color": True}),         # Discrete
+    "transport_type": MappingProxyType({"fill_color": "GnBu", "reverse_color": False}),   # Discrete
+    "difference": MappingProxyType({"fill_color": "plasma", "reverse_color": False}),
+    "impacts": MappingProxyType({"fill_color": "Spectral", "reverse_color": True}),
+})
 """ Default values for choropleth color palettes, by analysis type. """
 
 
@@ -127,8 +133,8 @@ DEFAULT_THRESHOLDS_SCALE_COLOR = {
 # Functions
 # -----------------------------------------------------------------------------
 def generate_level_to_type_mapping(
-    dct_level: Dict[str, int],
-    dct_type: Dict[str, int],
+    dct_level: Mapping[str, int],
+    dct_type: Mapping[str, int],
     prefix: str = "NTS",
 ) -> dict:
     """
@@ -156,6 +162,20 @@ def generate_level_to_type_mapping(
     return mapping
 
 
+# -----------------------------------------------------------------------------
+# Derived lookups (computed once at import)
+# -----------------------------------------------------------------------------
+LEVEL_TO_TYPE: Mapping[int, int] = MappingProxyType(generate_level_to_type_mapping(DCT_LEVEL, DCT_TYPE))
+""" Mapping from ``DCT_LEVEL`` values to the matching 'NTS-<level>' ``DCT_TYPE`` values.  
+Use ``generate_level_to_type_mapping()`` directly only for a custom prefix. """
+
+DCT_TYPE_INV: Mapping[int, str] = MappingProxyType({v: k for k, v in DCT_TYPE.items()})
+""" Inverse of ``DCT_TYPE``: DB 'type' code → transport type name. """
+
+DCT_LEVEL_INV: Mapping[int, str] = MappingProxyType({v: k for k, v in DCT_LEVEL.items()})
+""" Inverse of ``DCT_LEVEL``: DB 'level' code → level name. """
+
+
 # -----------------------------------------------------------------------------
 # Internal compatibility v1.0.x (intentionally undocumented)
 # -----------------------------------------------------------------------------
@@ -173,4 +193,4 @@ defaults_thresholds_scale_color = DEFAULT_THRESHOLDS_SCALE_COLOR
 # -----------------------------------------------------------------------------
 if __name__ == "__main__":
     _map = generate_level_to_type_mapping(DCT_LEVEL, DCT_TYPE)
-    print(_map)
\ No newline at end of file
+    print(_map, _map == LEVEL_TO_TYPE)
\ No newline at end of file
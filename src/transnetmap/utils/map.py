@@ -11,22 +11,25 @@ This module provides small utilities to:
 Notes
 -----
 * Tiles validation uses ``transnetmap.utils.constant.DCT_VALID_TILES``.
+* Folium is imported lazily inside the functions that need it.
 """
 
 from __future__ import annotations
 
+import hashlib
+import math
 import os
 import tempfile
 import webbrowser
-from typing import TYPE_CHECKING, List, Optional, Tuple
-
-import folium
-import numpy as np
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple, Union
 
 from transnetmap.utils.constant import DCT_VALID_TILES
 
 if TYPE_CHECKING:  # noqa: F401
+    import folium
     import geopandas as gpd
+    import xyzservices
     from branca.element import Figure
 
 __all__ = ["show_map", "auto_fit_map", "setup_tiles"]
@@ -35,6 +38,47 @@ __all__ = ["show_map", "auto_fit_map", "setup_tiles"]
 # -----------------------------------------------------------------------------
 # File save & open
 # -----------------------------------------------------------------------------
+_SAVED_HTML: Dict[str, Tuple[str, int, int]] = {}
+""" Last HTML written by `show_map`, per path: (digest, size, mtime_ns) of the file. """
+
+_HTML_OPEN_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+)
+""" Flags for the unbuffered write of `_write_html` (``O_BINARY``: no newline translation on Windows). """
+
+
+def _write_html(map_object: folium.Map | Figure, save_path: str) -> None:
+    """
+    Write the HTML of ``map_object`` to ``save_path``, skipping an unchanged write.
+
+    The map is rendered on every call (as ``map_object.save`` does), so in-place edits
+    are always reflected. The disk write is skipped only when the same HTML was already
+    written to this path and the file has not been touched since (same size and
+    modification time).
+    """
+    html = map_object.get_root().render().encode("utf-8")
+    digest = hashlib.blake2b(html, digest_size=16).hexdigest()
+
+    previous = _SAVED_HTML.get(save_path)
+    if previous is not None and previous[0] == digest:
+        try:
+            stat = os.stat(save_path)
+        except OSError:
+            stat = None
+        if stat is not None and (stat.st_size, stat.st_mtime_ns) == previous[1:]:
+            return
+
+    fd = os.open(save_path, _HTML_OPEN_FLAGS, 0o644)
+    try:
+        view = memoryview(html)
+        while view:  # Usually a single write(2) for the whole document
+            view = view[os.write(fd, view):]
+        stat = os.fstat(fd)
+    finally:
+        os.close(fd)
+    _SAVED_HTML[save_path] = (digest, stat.st_size, stat.st_mtime_ns)
+
+
 def show_map(
     map_object: folium.Map | Figure,
     *,
@@ -93,11 +137,12 @@ def show_map(
         save_path = os.path.join(os.path.expanduser("~"), "Desktop", file_name)
     else:
         is_temporary = True
-        save_path = tempfile.NamedTemporaryFile(suffix=".html", delete=False).name
+        fd, save_path = tempfile.mkstemp(prefix="transnetmap_", suffix=".html")
+        os.close(fd)  # Only the path is needed; the HTML is written by `_write_html`
 
-    # Save the map with error handling
+    # Save the map with error handling (unchanged re-saves are skipped)
     try:
-        map_object.save(save_path)
+        _write_html(map_object, save_path)
     except Exception as e:
         raise RuntimeError(f"Failed to save map to '{save_path}': {e}")
 
@@ -113,7 +158,7 @@ def show_map(
 
     # Open the map if required (Temporary files always open)
     if is_temporary or open_browser:
-        webbrowser.open(f"file://{save_path}")
+        webbrowser.open("file://" + save_path, new=2, autoraise=False)  # New tab, don't wait for raise
 
     return None
 
@@ -164,6 +209,8 @@ def auto_fit_map(
     - Setting ``tiles=False`` removes the background tile layer (useful when overlaying
       only custom layers).
     """
+    import folium
+
     if location is not None and zoom_start is None:
         raise ValueError("If `location` is specified, `zoom_start` must also be provided.")
 
@@ -172,10 +219,10 @@ def auto_fit_map(
 
     # Get bounds (minx, miny, maxx, maxy)
     bounds = getattr(gdf, "total_bounds", None)
-    if bounds is None or np.isnan(bounds).all():
+    if bounds is None or any(math.isnan(b) for b in bounds):
         raise ValueError("Invalid bounding box computed from the GeoDataFrame.")
 
-    minx, miny, maxx, maxy = bounds
+    minx, miny, maxx, maxy = map(float, bounds)  # Plain floats for the arithmetic below
 
     # Auto-center if `location` is not provided
     if location is None and zoom_start is not None:
@@ -195,20 +242,43 @@ def auto_fit_map(
 # -----------------------------------------------------------------------------
 # Tile setup
 # -----------------------------------------------------------------------------
-def setup_tiles(mymap: folium.Map, *, map_tiles: Optional[List[str]] = None) -> folium.Map:
+_VALID_TILE_NAMES: Tuple[str, ...] = tuple(DCT_VALID_TILES)
+""" Valid tile names, in `DCT_VALID_TILES` order (listed in error messages). """
+
+
+@lru_cache(maxsize=None)
+def _tile_source(tile: str) -> Union[str, "xyzservices.TileProvider"]:
+    """
+    Resolve the `DCT_VALID_TILES` entry of ``tile`` to its ``xyzservices`` provider, once.
+
+    ``folium.TileLayer`` performs the same lookup (a search through every provider)
+    on each instantiation when given a name; passing the resolved provider skips it.
+    Unknown names (e.g. custom URLs) are returned unchanged.
+    """
+    import xyzservices
+
+    source = DCT_VALID_TILES[tile]
+    query = "OpenStreetMap Mapnik" if source.lower() == "openstreetmap" else source  # As folium does
+    try:
+        return xyzservices.providers.query_name(query)
+    except ValueError:
+        return source
+
+
+def setup_tiles(mymap: folium.Map, *, map_tiles: Optional[Sequence[str]] = None) -> folium.Map:
     """
     Add tile layers to a Folium map and set the default visible layer.
 
-    If ``"OpenRailwayMap"`` is in the list, it is treated as an overlay; a base layer
-    is ensured if necessary.
+    ``"OpenRailwayMap"`` is currently dropped from the list (see Notes).
 
     Parameters
     ----------
     mymap : folium.Map
         Map object to which tile layers are added.
-    map_tiles : list of str, optional
+    map_tiles : sequence of str, optional
         Names of tile layers to add. The first tile is the default visible layer.
         If not provided or empty, defaults to ``["CartoDB Voyager"]``.
+        The sequence is copied, never modified in place.
 
     Returns
     -------
@@ -220,40 +290,30 @@ def setup_tiles(mymap: folium.Map, *, map_tiles: Optional[List[str]] = None) ->
     - The ``OpenRailwayMap`` tile provider is temporarily disabled in v1 due to loading failures.
       It may be reintroduced in a future release.
     """
-    if not map_tiles:
-        map_tiles = ["CartoDB Voyager"]  # Default tile layer
+    import folium
+
+    # Work on a copy: the caller's sequence (e.g. `HeatMapConfig.map_tiles`) may be a tuple
+    map_tiles = list(map_tiles) if map_tiles else ["CartoDB Voyager"]  # Default tile layer
 
     # Ensure only valid tiles are used
-    for i, tile in enumerate(map_tiles):
+    for tile in map_tiles:
         if tile not in DCT_VALID_TILES:
-            raise ValueError(f"Invalid tile layer: '{tile}'. Choose from {list(DCT_VALID_TILES.keys())}.")
+            raise ValueError(f"Invalid tile layer: '{tile}'. Choose from {list(_VALID_TILE_NAMES)}.")
 
-    # TODO: V2, Remove if "OpenRailwayMap" is working properly
+    # TODO: V2, Restore OpenRailwayMap as a visible overlay (first layer, plus a base map
+    #       if alone) once it is working properly
     if "OpenRailwayMap" in map_tiles:
-        map_tiles.remove("OpenRailwayMap")
+        map_tiles = [tile for tile in map_tiles if tile != "OpenRailwayMap"]
         print("The 'OpenRailwayMap' tile has been disabled due to loading errors and will be re-evaluated in v2.")
 
-    # Ensure OpenRailwayMap is the first layer if present
-    if "OpenRailwayMap" in map_tiles:
-        map_tiles.remove("OpenRailwayMap")
-        map_tiles.insert(0, "OpenRailwayMap")
-
-        # Ensure at least one base map exists
-        if len(map_tiles) == 1:
-            map_tiles.append("CartoDB VoyagerLabelsUnder")  # Default base map if OpenRailwayMap is alone
-
-        nb_show = [0, 1]  # Show first two layers
-    else:
-        nb_show = [0]  # Show only the first layer
-
-    # Add tile layers to the map
+    # Add tile layers to the map (only the first one is shown)
     for i, tile in enumerate(map_tiles):
         folium.TileLayer(
-            DCT_VALID_TILES[tile],
+            _tile_source(tile),
             name=tile,
-            overlay=(tile == "OpenRailwayMap"),  # ORW stays as overlay
+            overlay=False,
             control=True,
-            show=(i in nb_show),
+            show=(i == 0),
         ).add_to(mymap)
 
     return mymap
@@ -263,6 +323,8 @@ def setup_tiles(mymap: folium.Map, *, map_tiles: Optional[List[str]] = None) ->
 # Manual test (no side effects at import)
 # -----------------------------------------------------------------------------
 if __name__ == "__main__":
+    import folium
+
     m = folium.Map(location=[47.03743, 8.35966], zoom_start=8, tiles=None)
     setup_tiles(m, ["CartoDB Positron", "OpenStreetMap Mapnik", "OpenStreetMap"])
     folium.LayerControl().add_to(m)
@@ -15,6 +15,7 @@ Notes
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
 import numpy as np
@@ -28,6 +29,33 @@ __all__ = [
 ]
 
 
+# -----------------------------------------------------------------------------
+# Internal helpers
+# -----------------------------------------------------------------------------
+_MIN_MAX_BLOCK = 1 << 16
+""" Block size (elements) for `_min_max`; 512 KiB of float64, small enough to stay in cache. """
+
+
+def _min_max(data: np.ndarray) -> Tuple[float, float]:
+    """
+    Return ``(min, max)`` of ``data`` reading the array from memory only once.
+
+    Large arrays are reduced block by block, so the ``max`` reduction runs on a block
+    still in cache instead of a second full pass. NaN values propagate as with
+    ``data.min()`` / ``data.max()``.
+    """
+    data = np.ravel(data)
+    if data.size <= _MIN_MAX_BLOCK:
+        return float(data.min()), float(data.max())
+
+    lo, hi = np.inf, -np.inf
+    for start in range(0, data.size, _MIN_MAX_BLOCK):
+        block = data[start:start + _MIN_MAX_BLOCK]
+        lo = np.minimum(lo, block.min())
+        hi = np.maximum(hi, block.max())
+    return float(lo), float(hi)
+
+
 # -----------------------------------------------------------------------------
 # Discrete scales — transport type / 'changes'
 # -----------------------------------------------------------------------------
@@ -38,10 +66,8 @@ def compute_boolean_scale_type(data: np.ndarray) -> Tuple[List[float], float, fl
 
     Logic:
     
-    - Builds bins around the expected values (e.g. 6 and 7)
-    - Creates [val - 0.5, val + 0.5] around each value
-    - Merges and sorts the edges
-    - Adds an artificial bin before if the values are consecutive (e.g. [6, 7] → add 4.5)
+    - Builds bins [val - 0.5, val + 0.5] around the expected values (e.g. 6 and 7)
+    - Adds an artificial bin before them if the values are consecutive (e.g. [6, 7] → add 4.5)
 
     Parameters
     ----------
@@ -63,29 +89,23 @@ def compute_boolean_scale_type(data: np.ndarray) -> Tuple[List[float], float, fl
     """
     from transnetmap.utils.constant import DCT_TYPE
 
-    expected_vals = {DCT_TYPE['with-NTS'], DCT_TYPE['extend-NTS']}
-    unique_vals = set(np.unique(data))
-
-    if unique_vals != expected_vals:
-        raise ValueError(f"Expected only values {expected_vals} for `transport_type`, got: {unique_vals}")
+    expected_vals = np.array(sorted((DCT_TYPE['with-NTS'], DCT_TYPE['extend-NTS'])))
+    unique_vals = np.unique(data)  # Sorted, compared without building Python objects
 
-    min_val, max_val = float(min(expected_vals)), float(max(expected_vals))
+    if not np.array_equal(unique_vals, expected_vals):
+        raise ValueError(
+            f"Expected only values {expected_vals.tolist()} for `transport_type`, got: {unique_vals.tolist()}"
+        )
 
-    # Step 1: build half-open bins [val - 0.5, val + 0.5] around each value
-    edges = set()
-    for val in expected_vals:
-        edges.add(val - 0.5)
-        edges.add(val + 0.5)
+    min_val, max_val = float(expected_vals[0]), float(expected_vals[-1])
 
-    scale = sorted(edges)
-
-    # Step 2: if there are only 3 bins (2 classes), add a fake bin before for folium
-    if len(scale) == 3:
-        scale.insert(0, min_val - 1.5)  # → now 4 bins (3 color classes)
-
-    # Step 3: safety check
-    if len(scale) != 4:
-        print(f"WARNING: scale for `transport_type` does not contain exactly 4 thresholds: {scale}")
+    # Bins [val - 0.5, val + 0.5] around each value → 4 edges (3 color classes)
+    if max_val - min_val == 1:
+        # Consecutive codes (current `DCT_TYPE`) share their middle edge:
+        # a fake bin is added before for folium
+        scale = [min_val - 1.5, min_val - 0.5, min_val + 0.5, max_val + 0.5]
+    else:
+        scale = [min_val - 0.5, min_val + 0.5, max_val - 0.5, max_val + 0.5]
 
     return scale, min_val, max_val
 
@@ -117,25 +137,18 @@ def compute_discrete_scale_changes(data: np.ndarray) -> Tuple[List[float], float
     ValueError
         If data contains negative values.
     """    
-    unique_values = np.unique(data)
+    unique_values = np.unique(data)  # Sorted
     
-    min_val = float(min(unique_values))
-    max_val = float(max(unique_values))
+    min_val = float(unique_values[0])
+    max_val = float(unique_values[-1])
     
     if min_val < 0:
         raise ValueError("No valid data found. Check dataset integrity.")
     
-    dynamic_scale = np.arange(min_val - 0.5, max_val + 1.5, 1).tolist()
-    
-    # Force full bin rendering, len(dynamic_scale) is always >= 2
-    match len(dynamic_scale):
-        case 2:
-            dynamic_scale.append(max_val + 1.5)
-            dynamic_scale.append(max_val + 2.5)
-        case 3:
-            dynamic_scale.append(max_val + 1.5)
-        case _:
-            pass
+    # One edge per value plus one (±0.5 around each integer), at least 4 edges to force
+    # full bin rendering (extra bins are appended after `max_val`)
+    n_edges = max(int(max_val - min_val) + 2, 4)
+    dynamic_scale = (np.arange(n_edges) + (min_val - 0.5)).tolist()
     
     return dynamic_scale, min_val, max_val
 
@@ -144,6 +157,37 @@ def compute_discrete_scale_changes(data: np.ndarray) -> Tuple[List[float], float
 # -----------------------------------------------------------------------------
 # Continuous scales — Jenks natural breaks
 # -----------------------------------------------------------------------------
+@lru_cache(maxsize=1)
+def _jenks_natural_breaks() -> type:
+    """
+    Return the ``jenkspy.JenksNaturalBreaks`` class, imported on first use only.
+
+    Only the class is cached: a classifier keeps the state of its last ``fit``,
+    so a fresh instance is created per call.
+    """
+    from jenkspy import JenksNaturalBreaks
+    return JenksNaturalBreaks
+
+
+_UNIQUE_PROBE_SIZE = 256
+""" Minimum prefix size probed before sorting the whole array in `_has_n_unique`. """
+
+
+def _has_n_unique(data: np.ndarray, n: int) -> bool:
+    """
+    Return whether ``data`` contains at least ``n`` distinct values.
+
+    A prefix is checked first: if it already holds ``n`` distinct values, so does the
+    whole array, and the full O(n log n) ``np.unique`` sort is skipped. The result is exact.
+    """
+    if data.size < n:
+        return False
+    probe = data[: max(4 * n, _UNIQUE_PROBE_SIZE)]
+    if np.unique(probe).size >= n:
+        return True
+    return probe.size < data.size and np.unique(data).size >= n
+
+
 def compute_jenks_dynamic_scale(data: np.ndarray, bins: int) -> Tuple[List[float], float, float]:
     """
     Computes a dynamic scale using Jenks Natural Breaks for continuous data.
@@ -175,16 +219,13 @@ def compute_jenks_dynamic_scale(data: np.ndarray, bins: int) -> Tuple[List[float
         - vmin (for Branca)
         - vmax (for Branca)
     """
-    min_val = float(data.min())
-    max_val = float(data.max())
-    unique_values = np.unique(data)
+    min_val, max_val = _min_max(data)
 
     # Fallback to linspace if not enough distinct values
-    if unique_values.size < bins:
+    if not _has_n_unique(data, bins):
         natural_breaks = np.linspace(min_val, max_val, bins)
     else:
-        from jenkspy import JenksNaturalBreaks
-        jnb = JenksNaturalBreaks(bins)
+        jnb = _jenks_natural_breaks()(bins)
         jnb.fit(data)
         natural_breaks = np.array(jnb.breaks_)
 
@@ -212,7 +253,7 @@ def compute_jenks_dynamic_scale(data: np.ndarray, bins: int) -> Tuple[List[float
     if rounded_breaks[0] < 0 < rounded_breaks[-1]:
         rounded_breaks = np.insert(rounded_breaks, np.searchsorted(rounded_breaks, 0), 0)
 
-    dynamic_scale = sorted(set(rounded_breaks.tolist()))
+    dynamic_scale = np.unique(rounded_breaks).tolist()  # Sorted, deduplicated
     
     return dynamic_scale, min_val, max_val
 
@@ -302,18 +343,23 @@ def validate_user_defined_scale(
     if not isinstance(scale, list) or len(scale) < 4:
         raise ValueError(f"User-defined scale for `{analysis_type}` must be a list of at least 4 numeric values.")
 
-    if not all(isinstance(x, (int, float)) for x in scale):
+    # Numeric check on the dtype NumPy infers: bool/int/float only, flat list
+    try:
+        arr = np.asarray(scale)
+    except ValueError:  # Ragged nested sequences
+        arr = None
+    if arr is None or arr.ndim != 1 or arr.dtype.kind not in "biuf":
         raise ValueError(f"Invalid scale values for `{analysis_type}`. Must be numeric: {scale}")
 
-    if any(scale[i] > scale[i + 1] for i in range(len(scale) - 1)):
+    arr = arr.astype(np.float64, copy=False)
+    if np.any(np.diff(arr) < 0):
         raise ValueError(f"Scale values for `{analysis_type}` must be monotonically increasing: {scale}")
 
-    scale = [float(x) for x in scale]
+    scale = arr.tolist()
     vmin = scale[0]
     vmax = scale[-1]
 
-    data_min = float(np.min(data))
-    data_max = float(np.max(data))
+    data_min, data_max = _min_max(data)
 
     if data_min < vmin or data_max > vmax:
         print(f"Data for `{analysis_type}` is outside user-defined scale range [{vmin}, {vmax}]. "
@@ -3,35 +3,235 @@
 SQL utilities for PostgreSQL/PostGIS interactions used by transnetmap.
 
 This module centralizes small helpers around executing SQL statements, validating the
-presence of schemas/tables/columns, and adding primary keys.
+presence of schemas/tables/columns, adding primary keys, and bulk-inserting pandas tables.
 
 Notes
 -----
 - Functions here are thin wrappers over psycopg2 and are intentionally simple.
+- Connections are reused through one small pool per URI (see `close_all_pools`).
 - SQL is passed as plain text with `%s` placeholders and parameters given as tuples/lists.
   (No `psycopg2.sql` composition objects are used in this module.)
+  Statements prepared server-side (``prepared_name``) use ``$1, $2, ...`` instead.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import csv
+import re
+import threading
+import time
+from io import StringIO
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
-import psycopg2
+from psycopg2 import InterfaceError, OperationalError, connect
+from psycopg2.errors import DuplicateSchema
+from psycopg2.extensions import connection as _PgConnection, encodings
+from psycopg2.extras import execute_values
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 
 __all__ = [
     "execute_sql_script",
+    "execute_sql_batch",
     "execute_primary_key_script",
     "define_schema",
     "schema_exists",
     "table_exists",
     "columns_exist",
     "validate_columns",
+    "insert_copy_from",
+    "close_all_pools",
+    "invalidate_exists_cache",
 ]
 
 
+# -----------------------------------------------------------------------------
+# Connection pools
+# -----------------------------------------------------------------------------
+_POOL_MAXCONN = 8
+""" Pooled connections per URI; beyond that, `_borrow_connection` opens a one-off connection. """
+
+class _PooledConnection(_PgConnection):
+    """
+    psycopg2 connection remembering the statements prepared on its server session.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.prepared: Set[str] = set()
+        self.pool: Optional[ThreadedConnectionPool] = None  # None: one-off connection (pool exhausted)
+
+
+_POOLS: Dict[str, ThreadedConnectionPool] = {}
+""" One connection pool per URI, created on first use. """
+
+_POOLS_LOCK = threading.Lock()
+""" Guards the creation and removal of pools in `_POOLS`. """
+
+
+def _get_pool(uri: str) -> ThreadedConnectionPool:
+    """
+    Return the connection pool of ``uri``, creating it (with one open connection) if needed.
+    """
+    pool = _POOLS.get(uri)
+    if pool is None:
+        with _POOLS_LOCK:
+            pool = _POOLS.get(uri)
+            if pool is None:
+                pool = _POOLS[uri] = ThreadedConnectionPool(
+                    1, _POOL_MAXCONN, uri, connection_factory=_PooledConnection
+                )
+    return pool
+
+
+def _borrow_connection(uri: str) -> _PooledConnection:
+    """
+    Return a connection to ``uri`` from its pool, or a one-off connection if the pool is exhausted.
+
+    Give it back with `_release_connection`.
+    """
+    pool = _get_pool(uri)
+    try:
+        conn = pool.getconn()
+    except PoolError:  # More than `_POOL_MAXCONN` threads: never fail where a plain connect would not
+        return connect(uri, connection_factory=_PooledConnection)
+    conn.pool = pool
+    return conn
+
+
+def _release_connection(conn: _PooledConnection, discard: bool = False) -> None:
+    """
+    Give back a connection from `_borrow_connection` (closed if one-off, broken or ``discard``).
+    """
+    if conn.pool is None:
+        conn.close()
+        return
+    try:
+        conn.pool.putconn(conn, close=discard)
+    except PoolError:  # Pool closed by `close_all_pools` meanwhile
+        conn.close()
+
+
+def _is_stale_connection_error(conn: _PooledConnection, error: BaseException) -> bool:
+    """
+    Return whether ``error`` comes from a connection closed while idle (server timeout or restart).
+    """
+    cause = error if isinstance(error, (OperationalError, InterfaceError)) else error.__cause__
+    return isinstance(cause, (OperationalError, InterfaceError)) and bool(conn.closed)
+
+
+def close_all_pools() -> None:
+    """
+    Close every pooled connection opened by `execute_sql_script`.
+
+    Useful before the database is dropped or restarted, or at the end of a long session.
+    New pools are created transparently on the next call.
+
+    Returns
+    -------
+    None
+    """
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.closeall()
+
+
+# -----------------------------------------------------------------------------
+# Existence cache
+# -----------------------------------------------------------------------------
+_EXISTS_CACHE_TTL = 30.0
+""" Seconds during which a positive `schema_exists` / `table_exists` answer is reused. """
+
+_EXISTS_CACHE: Dict[Tuple[str, str, str], float] = {}
+""" Positive existence answers: (uri, "schema" or "table", name) -> expiry (``time.monotonic``). """
+
+_COLUMNS_CACHE: Dict[Tuple[str, str, str], Tuple[float, FrozenSet[str]]] = {}
+""" Column names of a table: (uri, schema, table) -> (expiry, names), used by `columns_exist`. """
+
+_EXISTS_CACHE_LOCK = threading.Lock()
+""" Guards every write to `_EXISTS_CACHE`, `_COLUMNS_CACHE` and `_EXISTS_CACHE_EPOCH`. """
+
+_EXISTS_CACHE_EPOCH = 0
+""" Incremented by `invalidate_exists_cache`: answers queried before an invalidation are not stored. """
+
+_INVALIDATING_DDL_RE = re.compile(r"\b(?:DROP\s+(?:SCHEMA|TABLE)|ALTER\s+TABLE|RENAME)\b", re.IGNORECASE)
+""" Statements after which cached existence answers of the URI may be wrong. """
+
+
+def _exists_cached(uri: str, kind: str, name: str) -> bool:
+    """
+    Return whether ``name`` is known to exist (answer cached less than `_EXISTS_CACHE_TTL` ago).
+    """
+    expiry = _EXISTS_CACHE.get((uri, kind, name))
+    return expiry is not None and expiry > time.monotonic()
+
+
+def _remember_exists(uri: str, kind: str, name: str, epoch: int) -> None:
+    """
+    Cache a positive existence answer for `_EXISTS_CACHE_TTL` seconds, unless the cache was
+    invalidated since ``epoch`` (value of `_EXISTS_CACHE_EPOCH` read before the query).
+    """
+    with _EXISTS_CACHE_LOCK:
+        if epoch == _EXISTS_CACHE_EPOCH:
+            _EXISTS_CACHE[(uri, kind, name)] = time.monotonic() + _EXISTS_CACHE_TTL
+
+
+def _cached_columns(uri: str, schema: str, table: str) -> Optional[FrozenSet[str]]:
+    """
+    Return the cached column names of ``schema.table``, or ``None`` if unknown or expired.
+    """
+    entry = _COLUMNS_CACHE.get((uri, schema, table))
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    return entry[1]
+
+
+def _remember_columns(uri: str, schema: str, table: str, columns: FrozenSet[str], epoch: int) -> None:
+    """
+    Cache the column names of ``schema.table`` (same rules as `_remember_exists`).
+    """
+    with _EXISTS_CACHE_LOCK:
+        if epoch == _EXISTS_CACHE_EPOCH:
+            _COLUMNS_CACHE[(uri, schema, table)] = (time.monotonic() + _EXISTS_CACHE_TTL, columns)
+
+
+def invalidate_exists_cache(uri: Optional[str] = None) -> None:
+    """
+    Forget the cached answers of `schema_exists`, `table_exists` and `columns_exist`.
+
+    Only positive answers are relied upon (for a few seconds); the cache of a URI is
+    cleared automatically when `execute_sql_script` runs a ``DROP SCHEMA``,
+    ``DROP TABLE``, ``ALTER TABLE`` or ``RENAME``. Call this after dropping or renaming
+    objects by other means.
+
+    Parameters
+    ----------
+    uri : str, optional
+        Only forget the answers for this connection string. Default is ``None`` (all).
+
+    Returns
+    -------
+    None
+    """
+    global _EXISTS_CACHE_EPOCH
+    with _EXISTS_CACHE_LOCK:
+        _EXISTS_CACHE_EPOCH += 1  # Lookups still running may have read the dropped objects
+        for cache in (_EXISTS_CACHE, _COLUMNS_CACHE):
+            if uri is None:
+                cache.clear()
+            else:
+                for key in [key for key in list(cache) if key[0] == uri]:
+                    del cache[key]
+
+
 # -----------------------------------------------------------------------------
 # Core executor
 # -----------------------------------------------------------------------------
+_STREAM_ITERSIZE = 10_000
+""" Rows fetched per round-trip by the server-side cursor of `execute_sql_script` (``stream=True``). """
+
+
 def execute_sql_script(
     uri: str,
     script: str,
@@ -39,6 +239,11 @@ def execute_sql_script(
     fetch_all: bool = False,
     print_status: bool = True,
     raise_on_error: bool = True,
+    prepared_name: Optional[str] = None,
+    stream: bool = False,
+    many: Optional[Sequence[Sequence[Any]]] = None,
+    page_size: int = 1000,
+    conn: Optional[_PgConnection] = None,
 ) -> Optional[Union[Tuple[Any, ...], List[Tuple[Any, ...]]]]:
     """
     Execute an SQL script directly in the database and return results if applicable.
@@ -57,6 +262,29 @@ def execute_sql_script(
         If ``True``, displays status messages (default is ``True``).
     raise_on_error : bool, optional
         Whether to raise an exception on error. Default is ``True``.
+    prepared_name : str, optional
+        If provided, ``script`` is a single statement with ``$1, $2, ...`` placeholders:
+        it is prepared (``PREPARE``) once per pooled connection under this name, then
+        run with ``EXECUTE`` and ``params``. On a connection given with ``conn`` that is
+        not from the pool, it is prepared and deallocated around each call. Default is
+        ``None`` (plain execution).
+    stream : bool, optional
+        If ``True``, ``script`` must be a single ``SELECT``: rows are read through a
+        server-side cursor, `_STREAM_ITERSIZE` rows at a time, instead of being buffered
+        all at once by libpq. Useful with ``fetch_all`` on large results. Cannot be
+        combined with ``prepared_name``. Default is ``False``.
+    many : sequence of sequences, optional
+        Rows for a multi-row write: ``script`` contains a single ``VALUES %s`` placeholder
+        (e.g. ``INSERT INTO t (a, b) VALUES %s``) and the rows are sent with
+        `psycopg2.extras.execute_values`, ``page_size`` rows per statement. Cannot be
+        combined with ``params``, ``prepared_name`` or ``stream``. Default is ``None``.
+    page_size : int, optional
+        Rows per statement when ``many`` is given. Default is ``1000``.
+    conn : psycopg2.extensions.connection, optional
+        Open connection to run the script on (``uri`` is then only used for cache
+        invalidation), e.g. to run several statements in one transaction. Nothing is
+        committed and the connection is left open: the caller owns the transaction.
+        Default is ``None`` (a pooled connection is borrowed and released for this call only).
 
     Returns
     -------
@@ -70,7 +298,13 @@ def execute_sql_script(
     -----
     - For SELECT statements or any script returning results, only the first row is returned
       when ``fetch_all`` is ``False``.
-    - Commits are automatically performed for write operations.
+    - Commits are automatically performed for write operations (unless ``conn`` is given).
+    - The connection is taken from a per-URI pool and given back afterwards; an open
+      transaction (e.g. after a SELECT or an error) is rolled back by the pool, and a
+      broken connection is discarded. When the pool is exhausted, a one-off connection
+      is opened instead.
+    - If a pooled connection turns out to have been closed by the server while idle
+      (timeout, restart), the script is retried once on a new connection.
     
     Raises
     ------
@@ -79,7 +313,7 @@ def execute_sql_script(
     RuntimeError
         If an error occurs during SQL execution and ``raise_on_error`` is ``True``.
     """
-    conn = None
+    owned = conn is None  # Borrowed (and committed, released) here rather than lent by the caller
     error_occurred = False  # Tracks if an error occurred during execution
 
     try:
@@ -87,31 +321,36 @@ def execute_sql_script(
         if params and not isinstance(params, (list, tuple)):
             raise ValueError("The `params` argument must be a list or tuple of parameters.")
         
-        # Connect to the PostgreSQL database
-        conn = psycopg2.connect(uri)
-        with conn.cursor() as cur:
-            # Execute the SQL script with parameters
-            cur.execute(script, params)
-
-            # Check if the query returns results (e.g., a SELECT statement)
-            if cur.description:
-                if fetch_all:
-                    result = cur.fetchall()  # Fetch all rows
-                    if print_status:
-                        print(f"SQL script executed successfully with {len(result)} rows.")
-                    return result
-                else:
-                    result = cur.fetchone()  # Fetch the first row of the result
-                    if print_status:
-                        print("SQL script executed successfully with one result.")
-                    return result
-            else:
-                # If the query does not return rows (e.g., an INSERT/UPDATE/DELETE statement)
+        if stream and prepared_name is not None:
+            raise ValueError("The `stream` and `prepared_name` arguments cannot be combined.")
+        if many is not None and (params or prepared_name is not None or stream):
+            raise ValueError("The `many` argument cannot be combined with `params`, `prepared_name` or `stream`.")
+        
+        for attempt in (1, 2):
+            # Borrow a connection to the PostgreSQL database (unless the caller lends one)
+            if owned:
+                conn = _borrow_connection(uri)
+            try:
+                result, message, written = _run_script(
+                    conn, script, params, fetch_all, prepared_name, stream, many, page_size
+                )
+                break
+            except (OperationalError, InterfaceError) as error:
+                # A pooled connection left idle may have been closed by the server: nothing
+                # was committed on it, so discard it and retry once on a new connection
+                if not owned or attempt == 2 or not _is_stale_connection_error(conn, error):
+                    raise
+                _release_connection(conn, discard=True)
+                conn = None
+        
+        if written:
+            if owned:
                 conn.commit()
-                if print_status:
-                    operation = script.split()[0].upper()
-                    print(f"SQL script executed successfully: {operation} operation completed.")
-                return None
+            if _INVALIDATING_DDL_RE.search(script):
+                invalidate_exists_cache(uri)
+        if print_status:
+            print(message)
+        return result
 
     except Exception as error:
         # Mark that an error occurred and log the error message
@@ -123,16 +362,171 @@ def execute_sql_script(
         return None
 
     finally:
-        # Close the database connection
-        if conn is not None:
-            conn.close()
+        # Give the database connection back to the pool (borrowed connections only)
+        if owned and conn is not None:
+            _release_connection(conn)
             if print_status or error_occurred:
-                print("Database connection closed.")
+                print("Database connection released.")
+
+
+def _run_script(
+    conn: _PgConnection,
+    script: str,
+    params: Optional[Union[Sequence[Any], Tuple[Any, ...]]],
+    fetch_all: bool,
+    prepared_name: Optional[str],
+    stream: bool,
+    many: Optional[Sequence[Sequence[Any]]],
+    page_size: int,
+) -> Tuple[Optional[Union[Tuple[Any, ...], List[Tuple[Any, ...]]]], str, bool]:
+    """
+    Run ``script`` on ``conn`` for `execute_sql_script`, without committing.
+
+    Returns the result, the status message and whether the script wrote (needs a commit).
+    """
+    # Large SELECT: server-side (named) cursor, rows transferred in chunks
+    if stream:
+        with conn.cursor(name="_tnm_stream") as cur:
+            cur.itersize = _STREAM_ITERSIZE
+            cur.execute(script, params)
+            result = list(cur) if fetch_all else cur.fetchone()
+        count = f"{len(result)} rows" if fetch_all else "one result"
+        return result, f"SQL script executed successfully with {count}.", False
+    
+    # Multi-row write: one `INSERT ... VALUES (...), (...), ...` per page of rows
+    if many is not None:
+        with conn.cursor() as cur:
+            execute_values(cur, script, many, page_size=page_size)
+        return None, f"SQL script executed successfully: {len(many)} rows written.", True
+    
+    with conn.cursor() as cur:
+        # Execute the SQL script with parameters
+        # Statements prepared on this session, tracked by pooled connections only
+        prepared = getattr(conn, "prepared", None)
+        if prepared_name is None:
+            cur.execute(script, params)
+        else:
+            # Parse/plan once per server session (prepared statements survive rollbacks)
+            if prepared is None or prepared_name not in prepared:
+                cur.execute(f"PREPARE {prepared_name} AS {script}")
+                if prepared is not None:
+                    prepared.add(prepared_name)
+            args = f"({', '.join(['%s'] * len(params))})" if params else ""
+            cur.execute(f"EXECUTE {prepared_name}{args}", params)
+
+        # Check if the query returns results (e.g., a SELECT statement)
+        if cur.description:
+            if fetch_all:
+                result = cur.fetchall()  # Fetch all rows
+                message = f"SQL script executed successfully with {len(result)} rows."
+            else:
+                result = cur.fetchone()  # Fetch the first row of the result
+                message = "SQL script executed successfully with one result."
+            if prepared_name is not None and prepared is None:
+                cur.execute(f"DEALLOCATE {prepared_name}")  # Untracked session: leave nothing behind
+            return result, message, False
+        
+        if prepared_name is not None and prepared is None:
+            cur.execute(f"DEALLOCATE {prepared_name}")
+
+    # If the query does not return rows (e.g., an INSERT/UPDATE/DELETE statement)
+    operation = script.lstrip()[:16].split(None, 1)[0].upper()  # First keyword only
+    return None, f"SQL script executed successfully: {operation} operation completed.", True
+
+
+def execute_sql_batch(
+    uri: str,
+    statements: Iterable[Union[str, Tuple[str, Optional[Union[Sequence[Any], Tuple[Any, ...]]]]]],
+    print_status: bool = True,
+    raise_on_error: bool = True,
+) -> None:
+    """
+    Execute several write statements in a single round-trip and a single transaction.
+
+    Parameters
+    ----------
+    uri : str
+        PostgreSQL DB connection string.
+    statements : iterable of str or (str, params)
+        Statements to execute, in order. Each item is either a script or a
+        ``(script, params)`` pair with ``%s`` placeholders, as for `execute_sql_script`.
+    print_status : bool, optional
+        If ``True``, displays status messages (default is ``True``).
+    raise_on_error : bool, optional
+        Whether to raise an exception on error. Default is ``True``.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    RuntimeError
+        If an error occurs during SQL execution and ``raise_on_error`` is ``True``.
+        Nothing is committed in that case.
+
+    Notes
+    -----
+    - Parameters are bound client-side (``cursor.mogrify``), as psycopg2 always does, then
+      the statements are joined and sent as one script through `execute_sql_script`, on the
+      same connection.
+    - Intended for DDL such as ``ALTER TABLE`` / ``COMMENT ON`` sequences; statements
+      returning rows are not supported.
+
+    Examples
+    --------
+    >>> execute_sql_batch(uri, [
+    ...     'ALTER TABLE "network"."links" ADD CONSTRAINT links_pkey PRIMARY KEY ("id_a", "id_b")',
+    ...     ('COMMENT ON TABLE "network"."links" IS %s', ("Links of the network",)),
+    ... ])
+    """
+    statements = [(item, None) if isinstance(item, str) else item for item in statements]
+    if not statements:
+        return None
+    
+    # Bind, execute and commit on one connection (a single borrow, even when the pool is exhausted)
+    for attempt in (1, 2):
+        conn = _borrow_connection(uri)
+        try:
+            encoding = encodings[conn.encoding]
+            with conn.cursor() as cur:
+                parts = [
+                    cur.mogrify(script, params).decode(encoding).rstrip().rstrip(";")
+                    for script, params in statements
+                ]
+            execute_sql_script(
+                uri, ";\n".join(parts) + ";", print_status=print_status, raise_on_error=True, conn=conn
+            )
+            conn.commit()
+            break
+        except RuntimeError as error:
+            # Connection closed by the server while idle in the pool: retry once (nothing committed)
+            if attempt == 1 and _is_stale_connection_error(conn, error):
+                continue
+            if raise_on_error:
+                raise
+            print(f"Error executing SQL script: {error.__cause__}")
+            return None
+        finally:
+            _release_connection(conn)  # An uncommitted transaction is rolled back by the pool
+
+    return None
 
 
 # -----------------------------------------------------------------------------
 # DDL helpers
 # -----------------------------------------------------------------------------
+_PLAIN_IDENT_RE = re.compile(r"[a-z_][a-z0-9_$]*\Z", re.IGNORECASE)
+""" Identifiers usable unquoted in SQL (letters, digits, ``_`` and ``$``). """
+
+
+def _quote_ident(name: str) -> str:
+    """
+    Quote ``name`` as an SQL identifier (embedded double quotes are doubled).
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
 def execute_primary_key_script(
     uri: str,
     table: str,
@@ -140,6 +534,7 @@ def execute_primary_key_script(
     schema: str,
     include_schema_in_pk_name: bool = False,
     print_status: bool = True,
+    validate: bool = True,
 ) -> None:
     """
     Add a primary key constraint to a specified table in the PostgreSQL database,
@@ -159,6 +554,10 @@ def execute_primary_key_script(
         If ``True``, includes the schema name in the primary key constraint name. Default is ``False``.
     print_status : bool, optional
         If ``True``, prints status messages to the console. Default is ``True``.
+    validate : bool, optional
+        If ``True`` (default), checks that the schema, table and columns exist first.
+        Pass ``False`` right after writing the table to save that query; a missing
+        object then surfaces as a ``RuntimeError`` from PostgreSQL.
 
     Returns
     -------
@@ -168,7 +567,8 @@ def execute_primary_key_script(
     Raises
     ------
     ValueError
-        If the schema or table does not exist, or if any of the specified columns are missing.
+        If the schema or table does not exist, or if any of the specified columns are missing
+        (only when ``validate`` is ``True``).
     RuntimeError
         If an error occurs during the execution of the SQL script.
 
@@ -176,42 +576,47 @@ def execute_primary_key_script(
     -----
     - The primary key constraint name defaults to ``{table_name}_pkey``.
     - If ``include_schema_in_pk_name`` is ``True``, the constraint name becomes ``{schema}_{table_name}_pkey``.
-    - The function validates the schema, table, and column existence before attempting to add the constraint.
+    - The function validates the schema, table, and column existence before attempting to add the constraint
+      (one query), then adds it (a second query), both on the same pooled connection and transaction.
     - This function uses `execute_sql_script` for executing the SQL command.
     - The ``params`` argument in `execute_sql_script` is explicitly set to ``None`` as this method
       does not require dynamic parameters.
     """
-    # Step 1: Validate the schema
-    if not schema_exists(uri, schema, print_status=print_status):
-        raise ValueError(f"Schema '{schema}' does not exist in the database.")
-    
-    # Step 2: Validate the table
-    if not table_exists(uri, table, print_status=print_status):
-        raise ValueError(f"Table '{schema}.{table}' does not exist in the database.")
-        
-    # Step 3: Validate the columns
+    # Step 1: Validate the columns argument
     if not list_columns or not isinstance(list_columns, list):
         raise ValueError("'list_columns' must be a non-empty list of column names.")
     
-    # Check if columns exist in the specified table
-    column_check = columns_exist(uri, list_columns, table, schema, print_status=print_status)
-    missing_columns = [col for col, exists in column_check.items() if not exists]
-    if missing_columns:
-        raise ValueError(f"The following columns do not exist in table '{schema}.{table}': {', '.join(missing_columns)}")
-    
-    # Step 4: Construct the composite primary key string
-    pk_columns = ", ".join([f'"{col}"' for col in list_columns])
+    # Step 2: Construct the composite primary key string (identifiers quoted)
+    pk_columns = ", ".join(_quote_ident(col) for col in list_columns)
     pk_name = f"{schema}_{table}_pkey" if include_schema_in_pk_name else f"{table}_pkey"
-    table_full_name = f'"{schema}"."{table}"'
+    if not _PLAIN_IDENT_RE.match(pk_name):
+        pk_name = _quote_ident(pk_name)  # Plain names stay unquoted (folded to lower case as before)
+    table_full_name = f"{_quote_ident(schema)}.{_quote_ident(table)}"
     
-    # Step 5: Construct and execute the SQL script
+    # Step 3: Construct the SQL script
     script = f"""
     ALTER TABLE {table_full_name}
     ADD CONSTRAINT {pk_name} PRIMARY KEY ({pk_columns});
     """
     
-    # Execute the script with optional parameters (explicit param=None for clarity)
-    execute_sql_script(uri, script, params=None, print_status=print_status, raise_on_error=True)
+    # Step 4: Validate the schema, the table and the columns, then add the constraint,
+    # on one connection (its prepared statements are reused) and in one transaction
+    for attempt in (1, 2):
+        conn = _borrow_connection(uri)
+        try:
+            if validate:
+                _validate_primary_key_target(uri, table, list_columns, schema, print_status, conn)
+            
+            # Execute the script with optional parameters (explicit param=None for clarity)
+            execute_sql_script(uri, script, params=None, print_status=print_status, raise_on_error=True, conn=conn)
+            conn.commit()
+            break
+        except RuntimeError as error:
+            # Connection closed by the server while idle in the pool: retry once (nothing committed)
+            if attempt == 2 or not _is_stale_connection_error(conn, error):
+                raise
+        finally:
+            _release_connection(conn)  # An uncommitted transaction is rolled back by the pool
     
     if print_status:
         print(f"Primary key '{pk_name}' added successfully to table '{schema}.{table}'.")
@@ -219,6 +624,45 @@ def execute_primary_key_script(
     return None
 
 
+def _validate_primary_key_target(
+    uri: str, table: str, list_columns: List[str], schema: str, print_status: bool,
+    conn: Optional[_PgConnection] = None,
+) -> None:
+    """
+    Raise a ``ValueError`` if the schema, the table or any column of a primary key is missing.
+    """
+    script = """
+        SELECT
+            EXISTS (
+                SELECT 1 FROM information_schema.schemata WHERE schema_name = $1
+            ) AS schema_existence,
+            EXISTS (
+                SELECT 1 FROM information_schema.tables WHERE table_schema = $1 AND table_name = $2
+            ) AS table_existence,
+            ARRAY (
+                SELECT c.col
+                FROM unnest($3::text[]) WITH ORDINALITY AS c(col, pos)
+                WHERE NOT EXISTS (
+                    SELECT 1
+                    FROM information_schema.columns
+                    WHERE table_schema = $1 AND table_name = $2 AND column_name = c.col
+                )
+                ORDER BY c.pos
+            ) AS missing_columns
+    """
+    schema_ok, table_ok, missing_columns = execute_sql_script(
+        uri, script, params=(schema, table, list_columns), print_status=print_status,
+        prepared_name="_tnm_primary_key_check", conn=conn,
+    )
+    
+    if not schema_ok:
+        raise ValueError(f"Schema '{schema}' does not exist in the database.")
+    if not table_ok:
+        raise ValueError(f"Table '{schema}.{table}' does not exist in the database.")
+    if missing_columns:
+        raise ValueError(f"The following columns do not exist in table '{schema}.{table}': {', '.join(missing_columns)}")
+
+
 def define_schema(
     uri: str,
     name_schema: str,
@@ -253,28 +697,34 @@ def define_schema(
 
     Notes
     -----
-    - Uses `execute_sql_script` for executing SQL commands.
-    - Ensures the schema is created only if it does not exist.
+    - Uses `execute_sql_script` for executing SQL commands, in a single round-trip.
+    - The schema name is quoted, so its case is preserved.
     """
-    # Validate the schema name (SQL injection protection)
-    if schema_exists(uri, name_schema, print_status=print_status):
-        raise ValueError(f"Schema '{name_schema}' already exists in the database.")
+    # Quote the schema name as an identifier (case preserved, embedded quotes doubled)
+    quoted_schema = _quote_ident(name_schema)
     
     # Construct the SQL script to create the schema and optionally add a comment
     if text_comment:
+        quoted_schema = quoted_schema.replace("%", "%%")  # Literal '%' next to a `%s` parameter
         script = f"""
-        CREATE SCHEMA {name_schema};
-        COMMENT ON SCHEMA {name_schema} IS %s;
+        CREATE SCHEMA {quoted_schema};
+        COMMENT ON SCHEMA {quoted_schema} IS %s;
         """
         params = (text_comment,)
     else:
         script = f"""
-        CREATE SCHEMA {name_schema};
+        CREATE SCHEMA {quoted_schema};
         """
         params = None
     
-    # Execute the SQL script using the provided utility function
-    execute_sql_script(uri, script, params=params, print_status=print_status)
+    # Execute the SQL script using the provided utility function (no existence pre-check:
+    # an existing schema is reported by PostgreSQL itself)
+    try:
+        execute_sql_script(uri, script, params=params, print_status=print_status)
+    except RuntimeError as error:
+        if isinstance(error.__cause__, DuplicateSchema):
+            raise ValueError(f"Schema '{name_schema}' already exists in the database.") from None
+        raise
 
     return None
 
@@ -282,7 +732,7 @@ def define_schema(
 # -----------------------------------------------------------------------------
 # Existence checks
 # -----------------------------------------------------------------------------
-def schema_exists(uri: str, schema: str, print_status: bool = True) -> bool:
+def schema_exists(uri: str, schema: str, print_status: bool = False) -> bool:
     """
     Check if a schema exists in the PostgreSQL database.
 
@@ -293,7 +743,7 @@ def schema_exists(uri: str, schema: str, print_status: bool = True) -> bool:
     schema : str
         Name of the schema to check for existence (quoted correctly in the query).
     print_status : bool, optional
-        If ``True``, displays status messages during the execution (default is ``True``).
+        If ``True``, displays status messages during the execution (default is ``False``).
 
     Returns
     -------
@@ -304,27 +754,35 @@ def schema_exists(uri: str, schema: str, print_status: bool = True) -> bool:
     -----
     - This function uses `execute_sql_script` for executing the SQL command.
     - This function is safe to use even if the schema does not exist.
+    - A positive answer is cached for a few seconds (see `invalidate_exists_cache`).
     """
+    if _exists_cached(uri, "schema", schema):
+        return True
+    epoch = _EXISTS_CACHE_EPOCH
+    
     # SQL script to check schema existence
     script = """
         SELECT EXISTS (
             SELECT 1
             FROM information_schema.schemata
-            WHERE schema_name = %s
-        ) AS schema_existence;
+            WHERE schema_name = $1
+        ) AS schema_existence
     """
     
-    # Execute the SQL script and retrieve the result
-    result = execute_sql_script(uri, script, params=(schema,), print_status=print_status)
+    # Execute the SQL script (prepared once per connection) and retrieve the result
+    result = execute_sql_script(
+        uri, script, params=(schema,), print_status=print_status, prepared_name="_tnm_schema_exists"
+    )
     
     # Return True if schema exists, otherwise False
-    if result is not None:
-        return bool(result[0])  # The first column contains the result of EXISTS
+    if result is not None and result[0]:  # The first column contains the result of EXISTS
+        _remember_exists(uri, "schema", schema, epoch)
+        return True
     else:
         return False
 
 
-def table_exists(uri: str, table: str, print_status: bool = True) -> bool:
+def table_exists(uri: str, table: str, print_status: bool = False) -> bool:
     """
     Check if a table exists in the PostgreSQL database.
 
@@ -335,7 +793,7 @@ def table_exists(uri: str, table: str, print_status: bool = True) -> bool:
     table : str
         Name of the table to check for existence (quoted correctly in the query).
     print_status : bool, optional
-        If ``True``, displays status messages during the execution (default is ``True``).
+        If ``True``, displays status messages during the execution (default is ``False``).
 
     Returns
     -------
@@ -346,22 +804,30 @@ def table_exists(uri: str, table: str, print_status: bool = True) -> bool:
     -----
     - This function uses `execute_sql_script` for executing the SQL command.
     - This function works regardless of the schema, provided the table name is correct.
+    - A positive answer is cached for a few seconds (see `invalidate_exists_cache`).
     """
+    if _exists_cached(uri, "table", table):
+        return True
+    epoch = _EXISTS_CACHE_EPOCH
+    
     # SQL script to check table existence
     script = """
         SELECT EXISTS (
             SELECT 1
             FROM information_schema.tables
-            WHERE table_name = %s
-        ) AS table_existence;
+            WHERE table_name = $1
+        ) AS table_existence
     """
     
-    # Execute the SQL script and retrieve the result
-    result = execute_sql_script(uri, script, params=(table,), print_status=print_status)
+    # Execute the SQL script (prepared once per connection) and retrieve the result
+    result = execute_sql_script(
+        uri, script, params=(table,), print_status=print_status, prepared_name="_tnm_table_exists"
+    )
     
     # Return True if the table exists, otherwise False
-    if result is not None:
-        return bool(result[0])  # The first column contains the result of EXISTS
+    if result is not None and result[0]:  # The first column contains the result of EXISTS
+        _remember_exists(uri, "table", table, epoch)
+        return True
     else:
         return False
 
@@ -371,7 +837,7 @@ def columns_exist(
     columns: List[str],
     table: str,
     schema: str,
-    print_status: bool = True
+    print_status: bool = False
 ) -> Dict[str, bool]:
     """
     Check whether specified columns exist in a given table in the PostgreSQL database.
@@ -387,7 +853,7 @@ def columns_exist(
     schema : str
         Name of the schema containing the table.
     print_status : bool, optional
-        If ``True``, displays status messages during the execution (default is ``True``).
+        If ``True``, displays status messages during the execution (default is ``False``).
 
     Returns
     -------
@@ -399,34 +865,37 @@ def columns_exist(
     - This function uses `execute_sql_script` for executing the SQL command.
     - This function queries the ``information_schema.columns`` view to check for column existence.
     - Ensure that the schema and table names are properly quoted in the SQL query.
+    - The column names of the table are cached for a few seconds: a check whose columns
+      are all known is answered without a query (see `invalidate_exists_cache`).
     """
-    # SQL script to check column existence
+    # All requested columns already known: no query
+    known_columns = _cached_columns(uri, schema, table)
+    if known_columns is not None and known_columns.issuperset(columns):
+        return {col: True for col in columns}
+    epoch = _EXISTS_CACHE_EPOCH
+    
+    # SQL script fetching all column names of the table (cached for later checks)
     script = """
         SELECT column_name
         FROM information_schema.columns
-        WHERE table_name = %s
-        AND table_schema = %s
-        AND column_name IN %s;
+        WHERE table_name = $1
+        AND table_schema = $2
     """
-    columns_tuple = tuple(columns)  # Convert list to tuple for SQL
-    params = (table, schema, columns_tuple)
-    
-    # Execute the SQL script and retrieve the result
-    result = execute_sql_script(uri, script, params=params, fetch_all=True, print_status=print_status)
     
-    # Debugging: Print the raw result
-    if print_status:
-        print(f"Raw result from execute_sql_script: {result}")
+    # Execute the SQL script (prepared once per connection) and retrieve the result
+    result = execute_sql_script(
+        uri, script, params=(table, schema), fetch_all=True, print_status=print_status,
+        prepared_name="_tnm_table_columns",
+    )
     
     # Parse the result to determine column existence
-    if result is not None:
-        existing_columns = {row[0] for row in result}  # Extract existing column names from the result
-        return {col: (col in existing_columns) for col in columns}
-    else:
-        return {col: False for col in columns}
+    existing_columns = frozenset(row[0] for row in result) if result else frozenset()
+    if existing_columns:
+        _remember_columns(uri, schema, table, existing_columns, epoch)
+    return {col: (col in existing_columns) for col in columns}
 
 
-def validate_columns(uri: str, columns: List[str], table: str, schema: str, print_status: bool = True) -> str:
+def validate_columns(uri: str, columns: List[str], table: str, schema: str, print_status: bool = False) -> str:
     """
     Validate the existence of specified columns in a database table and format them for SQL queries.
 
@@ -441,7 +910,7 @@ def validate_columns(uri: str, columns: List[str], table: str, schema: str, prin
     schema : str
         Name of the schema containing the table.
     print_status : bool, optional
-        If ``True``, prints status messages to the console. Default is ``True``.
+        If ``True``, prints status messages to the console. Default is ``False``.
 
     Returns
     -------
@@ -471,3 +940,60 @@ def validate_columns(uri: str, columns: List[str], table: str, schema: str, prin
         
     columns_part = ", ".join(f'"{col}"' for col in columns)  # Properly quote column names
     return columns_part
+
+
+# -----------------------------------------------------------------------------
+# Bulk writers
+# -----------------------------------------------------------------------------
+def insert_copy_from(
+    table: Any,
+    conn: Any,
+    keys: List[str],
+    data_iter: Iterable[Tuple[Any, ...]],
+) -> int:
+    """
+    Insert rows with PostgreSQL ``COPY ... FROM STDIN`` (CSV format).
+
+    Intended as the ``method`` argument of ``pandas.DataFrame.to_sql``: rows are serialized
+    to an in-memory CSV buffer and streamed with `cursor.copy_expert`, avoiding any
+    per-row ``INSERT`` statement.
+
+    Parameters
+    ----------
+    table : pandas.io.sql.SQLTable
+        Target table, as passed by pandas (``table.schema`` and ``table.name`` are used).
+    conn : sqlalchemy.engine.Connection
+        Connection passed by pandas; its underlying psycopg2 connection is used.
+    keys : list of str
+        Column names, in row order.
+    data_iter : iterable of tuple
+        Rows to insert (missing values are given as ``None`` by pandas).
+
+    Returns
+    -------
+    int
+        Number of inserted rows.
+
+    Notes
+    -----
+    - ``None`` is written as ``\\N`` (declared as the NULL marker), so empty strings are kept as such.
+
+    Examples
+    --------
+    >>> table.to_sql("impacts_CO2_1", connection, schema="physical_values", method=insert_copy_from)
+    """
+    columns = ", ".join(f'"{key}"' for key in keys)
+    table_full_name = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+    script = f"COPY {table_full_name} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    rows = 0
+    for row in data_iter:
+        writer.writerow(["\\N" if value is None else value for value in row])
+        rows += 1
+    buffer.seek(0)
+    
+    with conn.connection.cursor() as cur:
+        cur.copy_expert(script, buffer)
+    return rows
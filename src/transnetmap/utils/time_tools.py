@@ -21,6 +21,7 @@ from __future__ import annotations
 
 from typing import Callable, Protocol, get_type_hints
 import inspect
+import weakref
 
 from transnetmap.analysis.time_functions import TIME_FUNCTION_REGISTERY
 
@@ -97,8 +98,10 @@ def import_time_function(function_name: str) -> TimeFunction:
         )
     fn = TIME_FUNCTION_REGISTERY[function_name]
 
-    # Validate the function (for additional safety)
-    validate_time_function(fn)
+    # Validate the function once (the registry is a plain dict: entries may bypass
+    # `register_time_function`); afterwards this is a set membership test
+    if fn not in _VALIDATED:
+        validate_time_function(fn)
 
     return fn  # type: ignore[return-value]  # validated at runtime
 
@@ -106,6 +109,13 @@ def import_time_function(function_name: str) -> TimeFunction:
 # -----------------------------------------------------------------------------
 # Validator
 # -----------------------------------------------------------------------------
+_VALIDATED: "weakref.WeakSet[Callable[..., float]]" = weakref.WeakSet()
+""" Functions that already passed `validate_time_function` (signature checks are skipped). """
+
+_REQUIRED_PARAMS = ("distance", "v_max", "acceleration", "deceleration")
+""" Parameter names (in order) of a time function, see `TimeFunction`. """
+
+
 def validate_time_function(fn: Callable[..., float]) -> None:
     """
     Validate a time calculation function to ensure it matches the expected signature.
@@ -119,37 +129,52 @@ def validate_time_function(fn: Callable[..., float]) -> None:
     ------
     TypeError
         If the function is not callable, or does not match the expected format.
+
+    Notes
+    -----
+    A function that passed once is remembered (weakly), so later calls, e.g. from
+    `import_time_function`, skip the ``inspect``/``typing`` reflection.
     """
     # Ensure the provided object is callable
     if not callable(fn):
         raise TypeError(f"The provided object '{fn}' is not a callable function.")
 
+    if fn in _VALIDATED:  # False for objects that are not weak-referenceable
+        return None
+
     # Check the function signature (names & order)
     signature = inspect.signature(fn)
     params = signature.parameters
 
-    required_params = ["distance", "v_max", "acceleration", "deceleration"]
-    if list(params.keys()) != required_params:
+    if tuple(params) != _REQUIRED_PARAMS:
         raise TypeError(
             f"Function '{fn.__name__}' must have exactly these parameters: "
-            f"{', '.join(required_params)}. "
-            f"Found: {', '.join(params.keys())}."
+            f"{', '.join(_REQUIRED_PARAMS)}. "
+            f"Found: {', '.join(params)}."
         )
 
-    # Resolve annotations (handles 'from __future__ import annotations')
-    if signature.return_annotation is inspect.Signature.empty:
+    # Check the return annotation
+    ret = signature.return_annotation
+    if ret is inspect.Signature.empty:
         raise TypeError(
             f"Function '{fn.__name__}' must have a return annotation 'float'."
         )
 
-    hints = get_type_hints(fn, globalns=getattr(fn, "__globals__", {}), include_extras=False)
-    ret = hints.get("return")
+    # Resolve stringified annotations only (handles 'from __future__ import annotations')
+    if isinstance(ret, str):
+        hints = get_type_hints(fn, globalns=getattr(fn, "__globals__", {}), include_extras=False)
+        ret = hints.get("return")
 
     if ret is not float:
         raise TypeError(
             f"Function '{fn.__name__}' must return a float. Found: {ret!r}."
         )
 
+    try:
+        _VALIDATED.add(fn)
+    except TypeError:  # Not weak-referenceable (e.g. some builtins): checked on each call
+        pass
+
     return None
 
 
@@ -49,16 +49,9 @@ def read_mtx(file, comment_line_top=None, comment_line_rear=None):
             data_lines = lines[comment_line_top:-comment_line_rear]
         else: pass
         
-        # Initialize an empty dictionary for the final data
-        data_dict = {"from": [], "to": [], "value": []}
-        for line in data_lines:
-            # Split each line into columns
-            columns = line.split()
-            
-            # Append each column to the appropriate key in the dictionary
-            data_dict["from"].append(columns[0])
-            data_dict["to"].append(columns[1])
-            data_dict["value"].append(columns[2])
+        # Parse all lines at once (C parser, any whitespace) into one column array each
+        data = np.loadtxt(data_lines, usecols=(0, 1, 2), ndmin=2)
+        data_dict = {"from": data[:, 0], "to": data[:, 1], "value": data[:, 2]}
             
     return data_dict
 
@@ -69,14 +62,15 @@ def read_mtx(file, comment_line_top=None, comment_line_rear=None):
 file = raw_file_path / "Verkehrszonen_Schweiz_NPVM_2017_shp"
 name_base_id =  'ID' # The name of the 'ID' column depends on the base data
 
-zones = gpd.read_file(file).sort_values(by=name_base_id).reset_index(drop=True)
+zones = gpd.read_file(file)
 
+# Filter on the study area first, then sort only the selected zones
 extract = zones[
     zones["N_AMR"].isin([
         "Lausanne", "Renens\x96Ecublens", "Montreux\x96Vevey", "Prilly\x96Le Mont-sur-Lausanne", "Nyon",
         "Vernier\x96Lancy", "Thônex\x96Chêne-Bougeries", "Genève", "Le Grand-Saconnex", "Rolle\x96Saint-Prex"
         ])
-    ]
+    ].sort_values(by=name_base_id).reset_index(drop=True)
 simplify = extract.copy()
 
 # The name of the column containing the geometries must be "geom".
@@ -102,7 +96,7 @@ simplify.rename(columns={name_base_id:'nptmid'}, inplace=True)
 simplify = simplify[['id', 'geom', 'nptmid', 'ID_alt', 'ID_Gem', 'N_Gem', 'stg_type', 'N_stg_type',
        'ID_KT', 'N_KT', 'ID_SL3', 'N_SL3', 'ID_Agglo', 'N_Agglo', 'ID_AMR', 'N_AMR']]
 
-ids = np.sort(simplify["nptmid"].unique())
+ids = pl.Series("nptmid", np.sort(simplify["nptmid"].unique()))  # Converted once for the four filters
 expr_mask = pl.col("from").is_in(ids) & (pl.col("to").is_in(ids))
 
 # ===============================
@@ -111,18 +105,23 @@ expr_mask = pl.col("from").is_in(ids) & (pl.col("to").is_in(ids))
 
 file = raw_file_path / "DWV_2017_Strasse_Reisezeit_Distanz_CH\DWV_2017_Strasse_Reisezeit_CH.mtx"
 
-imt_time = pl.DataFrame(
-    read_mtx(file, 
-             comment_line_top=comment_line_top, 
-             comment_line_rear=comment_line_rear
-             )
-)
-imt_time = imt_time.with_columns(
+# Cast and filter in a single lazy plan
+imt_time = (
+    pl.DataFrame(
+        read_mtx(file, 
+                 comment_line_top=comment_line_top, 
+                 comment_line_rear=comment_line_rear
+                 )
+    )
+    .lazy()
+    .with_columns(
         pl.col("from").cast(pl.Int64),
         pl.col("to").cast(pl.Int64),
         pl.col("value").cast(pl.Float32)
+    )
+    .filter(expr_mask)
+    .collect()
 )
-imt_time = imt_time.filter(expr_mask)
 
 # ===============================
 # === Step 2 : IMT travel distance ===
@@ -130,18 +129,23 @@ imt_time = imt_time.filter(expr_mask)
 
 file = raw_file_path / "DWV_2017_Strasse_Reisezeit_Distanz_CH\DWV_2017_Strasse_Distanz_CH.mtx"
 
-imt_length = pl.DataFrame(
-    read_mtx(file, 
-             comment_line_top=comment_line_top, 
-             comment_line_rear=comment_line_rear
-            )
-)
-imt_length = imt_length.with_columns(
+# Cast and filter in a single lazy plan
+imt_length = (
+    pl.DataFrame(
+        read_mtx(file, 
+                 comment_line_top=comment_line_top, 
+                 comment_line_rear=comment_line_rear
+                 )
+    )
+    .lazy()
+    .with_columns(
         pl.col("from").cast(pl.Int64),
         pl.col("to").cast(pl.Int64),
         pl.col("value").cast(pl.Float32)
+    )
+    .filter(expr_mask)
+    .collect()
 )
-imt_length = imt_length.filter(expr_mask)
 
 # ===============================
 # === Step 3 : PT travel time ===
@@ -149,21 +153,26 @@ imt_length = imt_length.filter(expr_mask)
 
 file = raw_file_path / "DWV_2017_OeV_Reisezeit_Distanz_CH\DWV_2017_ÖV_Reisezeit_CH.mtx"
 
-pt_time = pl.DataFrame(
-    read_mtx(file, 
-             comment_line_top=comment_line_top, 
-             comment_line_rear=comment_line_rear
-             )
+# Cast, replace the "no relation" value and filter in a single lazy plan
+pt_time = (
+    pl.DataFrame(
+        read_mtx(file, 
+                 comment_line_top=comment_line_top, 
+                 comment_line_rear=comment_line_rear
+                 )
     )
-pt_time = pt_time.with_columns(
-                    pl.col("from").cast(pl.Int64),
-                    pl.col("to").cast(pl.Int64),
-                    pl.col("value").cast(pl.Float32)
-                    )
-pt_time = pt_time.with_columns(
-    pl.when(pl.col("value") == no_relations_value).then(None).otherwise(pl.col("value")).alias("value")
+    .lazy()
+    .with_columns(
+        pl.col("from").cast(pl.Int64),
+        pl.col("to").cast(pl.Int64),
+        pl.col("value").cast(pl.Float32)
+    )
+    .with_columns(
+        pl.when(pl.col("value") == no_relations_value).then(None).otherwise(pl.col("value")).alias("value")
     )
-pt_time = pt_time.filter(expr_mask)
+    .filter(expr_mask)
+    .collect()
+)
 
 # ===============================
 # === Step 4 : PT travel distance ===
@@ -171,21 +180,26 @@ pt_time = pt_time.filter(expr_mask)
 
 file = raw_file_path / "DWV_2017_OeV_Reisezeit_Distanz_CH\DWV_2017_ÖV_Distanz_CH.mtx"
 
-pt_length = pl.DataFrame(
-    read_mtx(file, 
-             comment_line_top=comment_line_top, 
-             comment_line_rear=comment_line_rear
-             )
+# Cast, replace the "no relation" value and filter in a single lazy plan
+pt_length = (
+    pl.DataFrame(
+        read_mtx(file, 
+                 comment_line_top=comment_line_top, 
+                 comment_line_rear=comment_line_rear
+                 )
+    )
+    .lazy()
+    .with_columns(
+        pl.col("from").cast(pl.Int64),
+        pl.col("to").cast(pl.Int64),
+        pl.col("value").cast(pl.Float32)
     )
-pt_length = pt_length.with_columns(
-                    pl.col("from").cast(pl.Int64),
-                    pl.col("to").cast(pl.Int64),
-                    pl.col("value").cast(pl.Float32)
-                    )
-pt_length = pt_length.with_columns(
-    pl.when(pl.col("value") == no_relations_value).then(None).otherwise(pl.col("value")).alias("value")
+    .with_columns(
+        pl.when(pl.col("value") == no_relations_value).then(None).otherwise(pl.col("value")).alias("value")
     )
-pt_length = pt_length.filter(expr_mask)
+    .filter(expr_mask)
+    .collect()
+)
 
 # ===============================
 # === Save the prepared data ===
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the validation of `PVS_TravelTime`, of the 'type' / 'max_distance' / 'impact_value'
+rules of `PVS_Impacts` and of its Parquet cache.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from transnetmap.pre.pvs import PVS_Impacts, PVS_TravelTime, _check_max_distance_runs
+
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+def _impacts_table(rows):
+    """
+    Build a raw impacts table (as read from the CSV) from (type, max_distance, impact_value) rows.
+    """
+    return pd.DataFrame({
+        "type": [row[0] for row in rows],
+        "max_distance": [row[1] for row in rows],
+        "impact_type": "CO2",
+        "impact_value": [row[2] for row in rows],
+        "impact_unit": "kg/pkm",
+        "motorization": "electric",
+        "load_percent": "",
+        "description": "test",
+        "comments": "",
+        "sources": "test",
+    }).astype(str)
+
+
+def _validate(rows):
+    """
+    Run the full validation of `PVS_Impacts` on ``rows``, without any database.
+    """
+    pvs = PVS_Impacts.__new__(PVS_Impacts)
+    pvs.impact_type = "CO2"
+    return pvs._validate_and_process_table(_impacts_table(rows))
+
+
+_VALID_ROWS = [
+    ("IMT", "-", "0.1"),
+    ("PT", "50", "0.2"),
+    ("PT", "-", "0.3"),
+    ("NTS-lower", "-", "0.4"),
+    ("NTS-main", "-", "0.5"),
+    ("NTS-higher", "-", "0.6"),
+]
+""" One valid table: every required type, 'PT' split in two distance classes. """
+
+
+# -----------------------------------------------------------------------------
+# _check_max_distance_runs
+# -----------------------------------------------------------------------------
+def test_runs_valid_table():
+    codes, bad_single, bad_nan, bad_unique = _check_max_distance_runs(
+        np.array([1, 0, 1, 1]), np.array([20.0, np.nan, np.nan, 10.0], dtype=np.float32)
+    )
+    assert codes.tolist() == [0, 1]
+    assert not bad_single.any() and not bad_nan.any() and not bad_unique.any()
+
+
+def test_runs_single_row_with_distance():
+    codes, bad_single, bad_nan, bad_unique = _check_max_distance_runs(
+        np.array([0, 1]), np.array([np.nan, 10.0], dtype=np.float32)
+    )
+    assert codes[bad_single].tolist() == [1]
+    assert not bad_nan.any() and not bad_unique.any()
+
+
+@pytest.mark.parametrize("distances", [[10.0, 20.0], [np.nan, np.nan, 10.0]])
+def test_runs_zero_or_several_nan(distances):
+    _, bad_single, bad_nan, _ = _check_max_distance_runs(
+        np.zeros(len(distances), dtype=np.intp), np.array(distances, dtype=np.float32)
+    )
+    assert bad_nan.tolist() == [True]
+    assert not bad_single.any()
+
+
+def test_runs_repeated_distance():
+    _, _, bad_nan, bad_unique = _check_max_distance_runs(
+        np.array([0, 0, 0]), np.array([10.0, np.nan, 10.0], dtype=np.float32)
+    )
+    assert bad_unique.tolist() == [True]
+    assert not bad_nan.any()
+
+
+# -----------------------------------------------------------------------------
+# PVS_Impacts._validate_and_process_table
+# -----------------------------------------------------------------------------
+def test_validate_valid_table():
+    table = _validate(_VALID_ROWS)
+    assert len(table) == len(_VALID_ROWS)
+    assert table["max_distance"].dtype == np.float32
+
+
+def test_validate_single_row_with_distance():
+    rows = [("IMT", "30", "0.1")] + _VALID_ROWS[1:]
+    with pytest.raises(ValueError, match=r"\['IMT'\].*exactly one row with NaN"):
+        _validate(rows)
+
+
+@pytest.mark.parametrize("pt_distances", [("50", "80"), ("-", "-")])
+def test_validate_zero_or_several_nan(pt_distances):
+    rows = [_VALID_ROWS[0], ("PT", pt_distances[0], "0.2"), ("PT", pt_distances[1], "0.3")] + _VALID_ROWS[3:]
+    with pytest.raises(ValueError, match=r"\['PT'\].*exactly one NaN value"):
+        _validate(rows)
+
+
+def test_validate_duplicate_type_impact_value():
+    rows = [_VALID_ROWS[0], ("PT", "50", "0.3"), ("PT", "-", "0.3")] + _VALID_ROWS[3:]
+    with pytest.raises(ValueError, match="Duplicate entries") as excinfo:
+        _validate(rows)
+    assert "more)" not in str(excinfo.value)
+
+
+def test_validate_duplicate_message_is_bounded():
+    # 30 'PT' distance classes sharing one impact value: 30 duplicate rows, 20 reported
+    rows = [_VALID_ROWS[0]] + [("PT", str(d), "0.3") for d in range(1, 30)] + [("PT", "-", "0.3")]
+    with pytest.raises(ValueError, match=r"\.\.\. \(10 more\)\Z") as excinfo:
+        _validate(rows + _VALID_ROWS[3:])
+    assert str(excinfo.value).count("PT") == 20
+
+
+def test_validate_non_numeric_value_names_column():
+    rows = [("IMT", "-", "abc")] + _VALID_ROWS[1:]
+    with pytest.raises(ValueError, match="'impact_value' column contains non-numeric values"):
+        _validate(rows)
+
+
+# -----------------------------------------------------------------------------
+# PVS_Impacts.read_csv(use_cache=True)
+# -----------------------------------------------------------------------------
+@pytest.fixture
+def impacts_csv(tmp_path):
+    file = tmp_path / "physical_values_impacts_CO2_1.csv"
+    _impacts_table(_VALID_ROWS).to_csv(file, sep=";", index=False)
+    return file
+
+
+@pytest.fixture
+def validations(monkeypatch):
+    """
+    Record every call of `PVS_Impacts._validate_and_process_table`.
+    """
+    calls = []
+    validate = PVS_Impacts._validate_and_process_table
+
+    def counting_validate(self, data, *, full=True):
+        calls.append(full)
+        return validate(self, data, full=full)
+
+    monkeypatch.setattr(PVS_Impacts, "_validate_and_process_table", counting_validate)
+    return calls
+
+
+def _impacts():
+    """
+    `PVS_Impacts` for the 'CO2' set 1, without any database.
+    """
+    pvs = PVS_Impacts.__new__(PVS_Impacts)
+    pvs.schema, pvs._type, pvs.impact_type = "physical_values", "impacts", "CO2"
+    pvs.physical_values_set_number, pvs.main_print = 1, False
+    return pvs
+
+
+def test_cache_is_reused_for_unchanged_csv(impacts_csv, validations):
+    first = _impacts().read_csv(impacts_csv, use_cache=True).table
+    second = _impacts().read_csv(impacts_csv, use_cache=True).table
+
+    assert len(validations) == 1
+    pd.testing.assert_frame_equal(first, second)
+    assert isinstance(second["type"].dtype, pd.CategoricalDtype)
+
+
+def test_cache_is_ignored_for_older_replacement_csv(impacts_csv, validations):
+    _impacts().read_csv(impacts_csv, use_cache=True)
+
+    # Replaced by another file with an older modification time (e.g. `cp -p`)
+    rows = [("IMT", "-", "0.9")] + _VALID_ROWS[1:]
+    _impacts_table(rows).to_csv(impacts_csv, sep=";", index=False)
+    old = impacts_csv.stat().st_mtime_ns - 3_600 * 10**9
+    os.utime(impacts_csv, ns=(old, old))
+
+    table = _impacts().read_csv(impacts_csv, use_cache=True).table
+    assert len(validations) == 2
+    assert table.loc[table["type"] == "IMT", "impact_value"].tolist() == [np.float32(0.9)]
+
+
+def test_cache_write_failure_only_warns(impacts_csv, monkeypatch):
+    import pyarrow.parquet as pq
+
+    def read_only(*args, **kwargs):
+        raise PermissionError("read-only file system")
+
+    monkeypatch.setattr(pq, "write_table", read_only)
+    with pytest.warns(RuntimeWarning, match="Could not write the Parquet cache"):
+        pvs = _impacts().read_csv(impacts_csv, use_cache=True)
+    assert len(pvs.table) == len(_VALID_ROWS)
+
+
+# -----------------------------------------------------------------------------
+# PVS_TravelTime._validate_and_process_table
+# -----------------------------------------------------------------------------
+_TRAVEL_TIME_NAMES = [
+    "tf_name", "l_ff", "m_ff", "h_ff",
+    "l_a_it", "l_b_it", "m_a_it", "m_b_it", "h_a_it", "h_b_it",
+    "l_aa", "l_ad", "m_aa", "m_ad", "h_aa", "h_ad",
+    "l_ts", "m_ts", "h_ts",
+]
+
+
+def _travel_time(values=None):
+    """
+    Load a raw travel time table (as read from the CSV) into a `PVS_TravelTime`, without any database.
+    """
+    values = {name: "suarm" if name == "tf_name" else "1.5" for name in _TRAVEL_TIME_NAMES} | (values or {})
+    data = pd.DataFrame({
+        "name": _TRAVEL_TIME_NAMES,
+        "value": [values[name] for name in _TRAVEL_TIME_NAMES],
+        "unit": "-",
+        "description": "test",
+        "comments": "",
+    })
+    pvs = PVS_TravelTime.__new__(PVS_TravelTime)
+    pvs._values_numeric, pvs._tf_name, pvs._meta, pvs.dct = pvs._validate_and_process_table(data)
+    return pvs
+
+
+def test_travel_time_components_and_table():
+    pvs = _travel_time({"l_ts": " 120 "})
+    assert pvs._values_numeric.dtype == np.float64
+    assert pvs.dct["tf_name"]["value"] == "suarm"
+    assert pvs.dct["l_ts"] == {"value": 120.0, "unit": "-", "description": "test", "comments": ""}
+    assert pvs.table.columns.tolist() == ["name", "value", "unit", "description", "comments"]
+    assert pvs.table["value"].tolist()[:2] == ["suarm", 1.5]
+
+
+@pytest.mark.parametrize("value", ["abc", "", "inf"])
+def test_travel_time_invalid_value(value):
+    with pytest.raises(ValueError, match="Invalid numeric values in the 'value' column for names: m_ff"):
+        _travel_time({"m_ff": value})
+
+
+def test_travel_time_invalid_tf_name():
+    with pytest.raises(ValueError, match="Invalid 'tf_name'"):
+        _travel_time({"tf_name": ""})
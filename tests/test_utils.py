@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the PostgreSQL array helpers of `transnetmap.utils.utils`.
+"""
+
+import numpy as np
+
+from transnetmap.utils.utils import convert_paths_to_pg_array, convert_to_pg_array
+
+
+def test_convert_paths_to_pg_array():
+    assert convert_paths_to_pg_array([[1, 2, 3], [4, 5]]) == ["{1,2,3}", "{4,5}"]
+
+
+def test_convert_paths_to_pg_array_numpy_paths():
+    paths = [np.array([4, 5, 6], dtype=np.int16), np.array([7], dtype=np.int64)]
+    assert convert_paths_to_pg_array(paths) == ["{4,5,6}", "{7}"]
+
+
+def test_convert_paths_to_pg_array_matches_single_path_helper():
+    paths = [[], [10], list(range(300))]
+    assert convert_paths_to_pg_array(paths) == [convert_to_pg_array(path) for path in paths]
+    assert convert_paths_to_pg_array(iter(paths))[0] == "{}"
+
+
+def test_convert_paths_to_pg_array_empty():
+    assert convert_paths_to_pg_array([]) == []